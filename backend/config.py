@@ -6,3 +6,5 @@ load_dotenv()
 TMDB_API_KEY = os.getenv("TMDB_API_KEY", "")
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./watchlist.db")
 TMDB_BASE_URL = "https://api.themoviedb.org/3"
+# Max concurrent TMDB requests when enriching many movies at once
+TMDB_MAX_WORKERS = int(os.getenv("TMDB_MAX_WORKERS", "8"))
@@ -1,14 +1,15 @@
 import pandas as pd
-from typing import List, Dict, Union, Optional
+from typing import List, Dict, Union, Optional, BinaryIO
 import logging
 from io import BytesIO
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
-def parse_watchlist_csv(file_path: Union[str, BytesIO]) -> List[Dict[str, str]]:
+def parse_watchlist_csv(file_path: Union[str, BinaryIO]) -> List[Dict[str, str]]:
     """
-    Parse a Letterboxd watchlist CSV file.
+    Parse a Letterboxd watchlist CSV file from a path or a binary file object
+    (BytesIO, or an upload's spooled temporary file).
     Expected columns: name (or Name), year (or Year), letterboxd_uri (or Letterboxd URI)
     """
     try:
@@ -18,8 +19,8 @@ def parse_watchlist_csv(file_path: Union[str, BytesIO]) -> List[Dict[str, str]]:
         
         for encoding in encodings:
             try:
-                # Reset file pointer if it's a BytesIO object
-                if isinstance(file_path, BytesIO):
+                # Reset file pointer if it's a file object
+                if not isinstance(file_path, str):
                     file_path.seek(0)
                 df = pd.read_csv(file_path, encoding=encoding)
                 logger.info(f"Successfully read CSV with encoding: {encoding}")
@@ -166,12 +167,21 @@ def parse_watchlist_csv(file_path: Union[str, BytesIO]) -> List[Dict[str, str]]:
             logger.error(error_msg)
             raise ValueError(error_msg)
         
-        # Clean and validate data
+        # Clean and validate data. Iterate plain column lists rather than
+        # df.iterrows(), which builds a pandas Series for every row.
         movies = []
-        for idx, row in df.iterrows():
-            name = str(row['name']).strip()
-            year = row['year']
-            uri = str(row['letterboxd_uri']).strip()
+        if 'date' in df.columns:
+            dates = df['date'].tolist()
+            # Letterboxd exports use ISO dates, so convert those in one vectorised
+            # pass; anything that doesn't match falls back to the per-row formats
+            iso_dates = pd.to_datetime(df['date'].astype(str).str.strip(), format='%Y-%m-%d', errors='coerce')
+            iso_dates = [None if pd.isna(d) else d.to_pydatetime() for d in iso_dates]
+        else:
+            dates = iso_dates = [None] * len(df)
+        rows = zip(df['name'].tolist(), df['year'].tolist(), df['letterboxd_uri'].tolist(), dates, iso_dates)
+        for idx, (raw_name, year, raw_uri, raw_date, iso_date) in enumerate(rows):
+            name = str(raw_name).strip()
+            uri = str(raw_uri).strip()
             
             # Validate year
             try:
@@ -189,10 +199,10 @@ def parse_watchlist_csv(file_path: Union[str, BytesIO]) -> List[Dict[str, str]]:
                 continue
             
             # Parse date if present
-            date_added = None
-            if 'date' in df.columns and pd.notna(row.get('date')):
+            date_added = iso_date
+            if date_added is None and raw_date is not None and pd.notna(raw_date):
                 try:
-                    date_str = str(row['date']).strip()
+                    date_str = str(raw_date).strip()
                     if date_str and date_str.lower() not in ['nan', 'none', '']:
                         # Try parsing various date formats
                         date_formats = [
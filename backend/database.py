@@ -9,7 +9,9 @@ import re
 
 logger = logging.getLogger(__name__)
 
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+# Listing queries are built from many optional filters, so allow more
+# compiled statement variants than the default 500 to stay cached
+engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False}, query_cache_size=1200)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
@@ -21,11 +23,17 @@ def get_db():
     finally:
         db.close()
 
+# (directory mtime, column names) from the last tracked-lists scan
+_tracked_list_names_cache = (None, [])
+
 def get_tracked_list_names():
     """
     Scan tracked-lists directory and return list of tracked list names.
     Returns list of column names (e.g., ['is_imdb_t250', 'is_letterboxd_t250'])
+    The scan is reused until a CSV is added, removed or renamed (which
+    changes the directory's mtime), since this runs on most requests.
     """
+    global _tracked_list_names_cache
     project_root = get_project_root()
     tracked_lists_dir = project_root / "tracked-lists"
 
@@ -33,13 +41,20 @@ def get_tracked_list_names():
         logger.warning(f"Tracked lists directory not found: {tracked_lists_dir}")
         return []
 
+    mtime = tracked_lists_dir.stat().st_mtime_ns
+    cached_mtime, cached_names = _tracked_list_names_cache
+    if cached_mtime == mtime:
+        return list(cached_names)
+
     list_names = []
     for csv_file in tracked_lists_dir.glob("*.csv"):
         filename = csv_file.stem
         column_name = 'is_' + re.sub(r'[-\s]+', '_', filename).lower()
         list_names.append(column_name)
 
-    return sorted(list_names)
+    list_names.sort()
+    _tracked_list_names_cache = (mtime, list_names)
+    return list(list_names)
 
 def filename_to_column_name(filename):
     """
@@ -83,6 +98,30 @@ def migrate_db():
                 conn.execute(text("ALTER TABLE movies ADD COLUMN notes TEXT"))
                 conn.commit()
 
+        with engine.connect() as conn:
+            movies_sql = conn.execute(
+                text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'movies'")
+            ).scalar() or ''
+        for column_name, (column_type, expression) in GENERATED_COLUMNS.items():
+            if column_name in columns and expression not in movies_sql:
+                # The generating expression changed; SQLite can't alter it in
+                # place, so drop the column (and its index) and add it again
+                logger.info(f"Recreating generated {column_name} column on movies table")
+                with engine.connect() as conn:
+                    conn.execute(text(f"DROP INDEX IF EXISTS ix_movies_{column_name}"))
+                    conn.execute(text(f"ALTER TABLE movies DROP COLUMN {column_name}"))
+                    conn.commit()
+                columns.remove(column_name)
+            if column_name not in columns:
+                logger.info(f"Adding generated {column_name} column to movies table")
+                with engine.connect() as conn:
+                    conn.execute(text(
+                        f"ALTER TABLE movies ADD COLUMN {column_name} {column_type} "
+                        f"GENERATED ALWAYS AS ({expression}) VIRTUAL"
+                    ))
+                    conn.execute(text(f"CREATE INDEX IF NOT EXISTS ix_movies_{column_name} ON movies({column_name})"))
+                    conn.commit()
+
         tracked_list_columns = get_tracked_list_names()
         for column_name in tracked_list_columns:
             if column_name not in columns:
@@ -90,6 +129,14 @@ def migrate_db():
                 with engine.connect() as conn:
                     conn.execute(text(f"ALTER TABLE movies ADD COLUMN {column_name} INTEGER DEFAULT 0"))
                     conn.commit()
+
+        existing_indexes = {index['name'] for index in inspector.get_indexes('movies')}
+        for index_name, index_columns in MOVIE_INDEXES.items():
+            if index_name not in existing_indexes:
+                logger.info(f"Creating {index_name} index on movies table")
+                with engine.connect() as conn:
+                    conn.execute(text(f"CREATE INDEX IF NOT EXISTS {index_name} ON movies({index_columns})"))
+                    conn.commit()
     else:
         logger.info("Movies table does not exist, will be created by init_db()")
 
@@ -119,9 +166,229 @@ def migrate_db():
             conn.execute(text("CREATE INDEX IF NOT EXISTS ix_seen_countries_country_name ON seen_countries(country_name)"))
             conn.commit()
 
+# tmdb_data as a JSON object, decoding legacy rows that hold the object as a
+# JSON string (like models.parse_tmdb_data), or NULL when there is none; json_*
+# calls over it in triggers and generated columns never raise on a bad row
+def _tmdb_object(row: str) -> str:
+    data = f"{row}tmdb_data"
+    legacy = f"json_extract({data}, '$')"
+    return (
+        f"CASE WHEN json_valid({data}) THEN CASE json_type({data}) "
+        f"WHEN 'object' THEN {data} "
+        f"WHEN 'text' THEN CASE WHEN json_valid({legacy}) THEN CASE json_type({legacy}) WHEN 'object' THEN {legacy} END END "
+        f"END END"
+    )
+
+# Path of the watch provider results to use from a tmdb_data object:
+# 'watch.providers' when it is a non-empty object, else legacy 'watch/providers'
+def _watch_provider_results(doc: str) -> str:
+    return (
+        f"CASE WHEN json_type({doc}, '$.watch.providers') = 'object' "
+        f"AND json(json_extract({doc}, '$.watch.providers')) != '{{}}' "
+        f"THEN '$.watch.providers.results' ELSE '$.\"watch/providers\".results' END"
+    )
+
+# Side tables derived from each movies row, kept in sync by SQLite triggers
+# (see ensure_derived_tables). Each entry maps the table to the movies columns
+# it depends on and the INSERT that builds its rows for NEW inside a trigger.
+DERIVED_TABLES = {
+    # The country column plus every tmdb_data.production_countries name, lowercased
+    'movie_countries': (('country', 'tmdb_data'), f"""
+        INSERT INTO movie_countries (movie_id, name_lower)
+        SELECT NEW.id, lower(NEW.country) WHERE NEW.country IS NOT NULL AND NEW.country != ''
+        UNION
+        SELECT NEW.id, lower(json_extract(pc.value, '$.name'))
+        FROM json_each({_tmdb_object('NEW.')}, '$.production_countries') AS pc
+        WHERE json_extract(pc.value, '$.name') IS NOT NULL;
+    """),
+    # Cast names as 'actor', and crew names as 'writer' (Writer, Screenplay) or
+    # 'producer' (Producer, Executive Producer), from tmdb_data.credits
+    'movie_people': (('tmdb_data',), f"""
+        INSERT INTO movie_people (movie_id, name, role)
+        SELECT NEW.id, json_extract(c.value, '$.name'), 'actor'
+        FROM json_each({_tmdb_object('NEW.')}, '$.credits.cast') AS c
+        WHERE json_extract(c.value, '$.name') IS NOT NULL
+        UNION
+        SELECT NEW.id, json_extract(c.value, '$.name'),
+               CASE WHEN json_extract(c.value, '$.job') IN ('Writer', 'Screenplay') THEN 'writer' ELSE 'producer' END
+        FROM json_each({_tmdb_object('NEW.')}, '$.credits.crew') AS c
+        WHERE json_extract(c.value, '$.name') IS NOT NULL
+          AND json_extract(c.value, '$.job') IN ('Writer', 'Screenplay', 'Producer', 'Executive Producer');
+    """),
+    # ISO 639-1 codes from tmdb_data.spoken_languages
+    'movie_spoken_languages': (('tmdb_data',), f"""
+        INSERT INTO movie_spoken_languages (movie_id, iso_639_1)
+        SELECT DISTINCT NEW.id, json_extract(sl.value, '$.iso_639_1')
+        FROM json_each({_tmdb_object('NEW.')}, '$.spoken_languages') AS sl
+        WHERE json_extract(sl.value, '$.iso_639_1') IS NOT NULL;
+    """),
+    # Facet values listed by the movie list's filter menus that have no side
+    # table of their own: 'genre' (genres column) and 'production_company'
+    # (tmdb_data.production_companies names)
+    'movie_facets': (('genres', 'tmdb_data'), f"""
+        INSERT INTO movie_facets (movie_id, kind, value)
+        SELECT NEW.id, 'genre', g.value
+        FROM json_each(CASE WHEN json_valid(NEW.genres) THEN NEW.genres END) AS g
+        WHERE json_type(NEW.genres) = 'array' AND g.value IS NOT NULL
+        UNION
+        SELECT NEW.id, 'production_company', json_extract(pc.value, '$.name')
+        FROM json_each({_tmdb_object('NEW.')}, '$.production_companies') AS pc
+        WHERE json_type({_tmdb_object('NEW.')}, '$.production_companies') = 'array'
+          AND pc.type = 'object' AND nullif(json_extract(pc.value, '$.name'), '') IS NOT NULL;
+    """),
+    # Every (region, provider type, provider id) in the watch provider results,
+    # e.g. ('US', 'flatrate', 8); non-object entries such as 'link' are skipped
+    'movie_providers': (('tmdb_data',), f"""
+        INSERT INTO movie_providers (movie_id, region, provider_type, provider_id)
+        SELECT DISTINCT NEW.id, r.key, k.key, json_extract(p.value, '$.provider_id')
+        FROM json_each({_tmdb_object('NEW.')}, {_watch_provider_results(_tmdb_object('NEW.'))}) AS r,
+             json_each(r.value) AS k,
+             json_each(k.value) AS p
+        WHERE r.type = 'object' AND k.type IN ('array', 'object')
+          AND CASE WHEN p.type = 'object' THEN json_extract(p.value, '$.provider_id') END IS NOT NULL;
+    """),
+}
+
+# Virtual generated columns on movies for scalar tmdb_data fields that are
+# filtered and sorted on; each gets an index (see migrate_db / models.Movie)
+GENERATED_COLUMNS = {
+    'original_language': ('TEXT', f"json_extract({_tmdb_object('')}, '$.original_language')"),
+    'in_collection': ('INTEGER', f"json_extract({_tmdb_object('')}, '$.belongs_to_collection') IS NOT NULL"),
+    # Whether availability filters evaluate the movie at all: a non-empty
+    # tmdb_data object, or a legacy JSON-string row that isn't empty
+    'has_tmdb_data': ('INTEGER', (
+        "CASE WHEN json_valid(tmdb_data) IS NOT 1 THEN 0 "
+        "WHEN json_type(tmdb_data) = 'object' THEN json(tmdb_data) != '{}' "
+        "WHEN json_type(tmdb_data) = 'text' THEN CASE "
+        "WHEN json_extract(tmdb_data, '$') = '' THEN 0 "
+        "WHEN json_valid(json_extract(tmdb_data, '$')) THEN json_type(json_extract(tmdb_data, '$')) = 'object' "
+        "ELSE 1 END "
+        "ELSE 0 END"
+    )),
+}
+
+# Indexes on movies added after the table first shipped; create_all only builds
+# indexes along with new tables, so migrate_db adds these to existing databases
+MOVIE_INDEXES = {
+    'ix_movies_runtime': 'runtime',
+    'ix_movies_created_at': 'created_at',
+    'ix_movies_is_favorite_year': 'is_favorite, year',
+    'ix_movies_title_year': 'title, year',
+}
+
+def ensure_derived_tables():
+    """
+    Create the triggers that keep each derived table in sync with movies, and
+    backfill a table from existing rows whenever its triggers are (re)created.
+    """
+    if engine.dialect.name != 'sqlite' or 'movies' not in inspect(engine).get_table_names():
+        return
+
+    with engine.connect() as conn:
+        for table, (source_columns, insert_sql) in DERIVED_TABLES.items():
+            existing_sql = conn.execute(
+                text("SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = :name"),
+                {"name": f"{table}_ai"}
+            ).scalar()
+            if existing_sql and insert_sql in existing_sql:
+                continue
+            if existing_sql:
+                # The derivation changed since the triggers were created: replace
+                # them and rebuild the table
+                for suffix in ('ai', 'au', 'ad'):
+                    conn.execute(text(f"DROP TRIGGER IF EXISTS {table}_{suffix}"))
+
+            logger.info(f"Creating {table} triggers and backfilling from movies")
+            conn.execute(text(f"""
+                CREATE TRIGGER IF NOT EXISTS {table}_au AFTER UPDATE OF {', '.join(source_columns)} ON movies
+                BEGIN
+                    DELETE FROM {table} WHERE movie_id = OLD.id;
+                    {insert_sql}
+                END
+            """))
+            conn.execute(text(f"""
+                CREATE TRIGGER IF NOT EXISTS {table}_ad AFTER DELETE ON movies
+                BEGIN
+                    DELETE FROM {table} WHERE movie_id = OLD.id;
+                END
+            """))
+            # Backfill through the update trigger so the derivation lives in one place
+            conn.execute(text(f"DELETE FROM {table}"))
+            conn.execute(text(f"UPDATE movies SET {source_columns[0]} = {source_columns[0]}"))
+            # Created last: its presence marks the backfill as done
+            conn.execute(text(f"""
+                CREATE TRIGGER {table}_ai AFTER INSERT ON movies
+                BEGIN
+                    {insert_sql}
+                END
+            """))
+            conn.commit()
+
+# Set once movies_fts exists; search falls back to plain LIKE scans without it
+_search_index_ready = False
+
+def ensure_search_index():
+    """
+    Create the movies_fts full-text index over title, director and notes (an
+    external-content FTS5 table with the trigram tokenizer, so MATCH does
+    case-insensitive substring search like the LIKE filters it accelerates),
+    plus the triggers that keep it in sync, and build it from existing rows.
+    Skipped when this SQLite build lacks FTS5 or the trigram tokenizer.
+    """
+    global _search_index_ready
+    if engine.dialect.name != 'sqlite' or 'movies' not in inspect(engine).get_table_names():
+        return
+
+    with engine.connect() as conn:
+        existing = conn.execute(text(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'movies_fts'"
+        )).first()
+        if not existing:
+            logger.info("Creating movies_fts search index")
+            try:
+                conn.execute(text("""
+                    CREATE VIRTUAL TABLE movies_fts USING fts5(
+                        title, director, notes,
+                        content='movies', content_rowid='id', tokenize='trigram'
+                    )
+                """))
+            except Exception as e:
+                logger.warning(f"Full-text search index unavailable, using LIKE search: {str(e)}")
+                return
+            conn.execute(text("""
+                CREATE TRIGGER movies_fts_ai AFTER INSERT ON movies BEGIN
+                    INSERT INTO movies_fts(rowid, title, director, notes)
+                    VALUES (NEW.id, NEW.title, NEW.director, NEW.notes);
+                END
+            """))
+            conn.execute(text("""
+                CREATE TRIGGER movies_fts_ad AFTER DELETE ON movies BEGIN
+                    INSERT INTO movies_fts(movies_fts, rowid, title, director, notes)
+                    VALUES ('delete', OLD.id, OLD.title, OLD.director, OLD.notes);
+                END
+            """))
+            conn.execute(text("""
+                CREATE TRIGGER movies_fts_au AFTER UPDATE OF title, director, notes ON movies BEGIN
+                    INSERT INTO movies_fts(movies_fts, rowid, title, director, notes)
+                    VALUES ('delete', OLD.id, OLD.title, OLD.director, OLD.notes);
+                    INSERT INTO movies_fts(rowid, title, director, notes)
+                    VALUES (NEW.id, NEW.title, NEW.director, NEW.notes);
+                END
+            """))
+            conn.execute(text("INSERT INTO movies_fts(movies_fts) VALUES ('rebuild')"))
+            conn.commit()
+
+    _search_index_ready = True
+
+def search_index_available() -> bool:
+    """Whether movies_fts exists and can be used to pre-filter searches."""
+    return _search_index_ready
+
 def init_db():
     """
     Initialize database and run migrations.
     """
     migrate_db()
     Base.metadata.create_all(bind=engine)
+    ensure_derived_tables()
+    ensure_search_index()
@@ -1,5 +1,7 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from database import init_db
 from routes import router
 import logging
@@ -19,7 +21,9 @@ async def lifespan(app: FastAPI):
 app = FastAPI(
     title="Letterboxd Watchlist API",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # orjson serializes the large movie list responses much faster than the stdlib encoder
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -34,6 +38,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger JSON/CSV responses (movie lists, exports); SSE streams opt out
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
 # Include routes
 app.include_router(router)
 
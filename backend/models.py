@@ -1,9 +1,42 @@
-from sqlalchemy import Column, Integer, String, JSON, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, JSON, DateTime, Boolean, ForeignKey, Computed, Index
 from sqlalchemy.sql import func
-from database import Base
+from sqlalchemy.types import TypeDecorator
+from typing import Any, Optional
+import orjson
+from database import Base, GENERATED_COLUMNS
+
+def parse_tmdb_data(tmdb_data: Any) -> Optional[dict]:
+    """
+    Return a movie's tmdb_data as a dict. Legacy rows may hold the object as
+    a JSON string, which is decoded with orjson. Undecodable strings give {}
+    and any other non-dict value gives None.
+    """
+    if isinstance(tmdb_data, dict):
+        return tmdb_data
+    if isinstance(tmdb_data, str):
+        try:
+            parsed = orjson.loads(tmdb_data)
+        except orjson.JSONDecodeError:
+            return {}
+        return parsed if isinstance(parsed, dict) else None
+    return None
+
+class TmdbJSON(TypeDecorator):
+    """JSON column for cached TMDb responses; always loads as a dict (or None), decoding legacy string rows."""
+    impl = JSON
+    cache_ok = True
+    hashable = False
+
+    def process_result_value(self, value, dialect):
+        return parse_tmdb_data(value)
 
 class Movie(Base):
     __tablename__ = "movies"
+    __table_args__ = (
+        Index("ix_movies_is_favorite_year", "is_favorite", "year"),
+        # Duplicate checks look movies up by title and year
+        Index("ix_movies_title_year", "title", "year"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, index=True)
@@ -11,15 +44,19 @@ class Movie(Base):
     letterboxd_uri = Column(String, unique=True, index=True)
     director = Column(String, index=True)
     country = Column(String, index=True)
-    runtime = Column(Integer)  # in minutes
+    runtime = Column(Integer, index=True)  # in minutes
     genres = Column(JSON)  # list of genre strings
     tmdb_id = Column(Integer, index=True)
-    tmdb_data = Column(JSON)  # Full TMDB movie data cache
+    tmdb_data = Column(TmdbJSON)  # Full TMDB movie data cache
     is_favorite = Column(Boolean, default=False, index=True)
     seen_before = Column(Boolean, default=False, index=True)
     notes = Column(String)  # User notes for the movie
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    # Generated from tmdb_data by SQLite (see database.GENERATED_COLUMNS); read-only
+    original_language = Column(String, Computed(GENERATED_COLUMNS['original_language'][1], persisted=False), index=True)
+    in_collection = Column(Integer, Computed(GENERATED_COLUMNS['in_collection'][1], persisted=False), index=True)
+    has_tmdb_data = Column(Integer, Computed(GENERATED_COLUMNS['has_tmdb_data'][1], persisted=False), index=True)
 
 class FavoriteDirector(Base):
     __tablename__ = "favorite_directors"
@@ -34,3 +71,68 @@ class SeenCountry(Base):
     id = Column(Integer, primary_key=True, index=True)
     country_name = Column(String, unique=True, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+class MovieCountry(Base):
+    """
+    One row per (movie, country) taken from the movie's country column and
+    tmdb_data.production_countries. Maintained by SQLite triggers on movies
+    (see database.ensure_derived_tables) so country filters can use an index.
+    """
+    __tablename__ = "movie_countries"
+
+    id = Column(Integer, primary_key=True, index=True)
+    movie_id = Column(Integer, ForeignKey("movies.id", ondelete="CASCADE"), index=True, nullable=False)
+    name_lower = Column(String, index=True, nullable=False)
+
+class MovieSpokenLanguage(Base):
+    """
+    One row per (movie, spoken language ISO 639-1 code) from
+    tmdb_data.spoken_languages, maintained by triggers like MovieCountry.
+    """
+    __tablename__ = "movie_spoken_languages"
+
+    id = Column(Integer, primary_key=True, index=True)
+    movie_id = Column(Integer, ForeignKey("movies.id", ondelete="CASCADE"), index=True, nullable=False)
+    iso_639_1 = Column(String, index=True, nullable=False)
+
+class MoviePerson(Base):
+    """
+    One row per (movie, person, role) from tmdb_data.credits, where role is
+    'actor', 'writer' or 'producer'. Maintained by triggers like MovieCountry.
+    """
+    __tablename__ = "movie_people"
+    __table_args__ = (Index("ix_movie_people_name_role", "name", "role"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    movie_id = Column(Integer, ForeignKey("movies.id", ondelete="CASCADE"), index=True, nullable=False)
+    name = Column(String, nullable=False)
+    role = Column(String, nullable=False)
+
+class MovieFacet(Base):
+    """
+    One row per (movie, kind, value) for filter facets without a table of
+    their own: kind 'genre' (from genres) or 'production_company' (from
+    tmdb_data.production_companies). Maintained by triggers like MovieCountry.
+    """
+    __tablename__ = "movie_facets"
+    __table_args__ = (Index("ix_movie_facets_kind_value", "kind", "value"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    movie_id = Column(Integer, ForeignKey("movies.id", ondelete="CASCADE"), index=True, nullable=False)
+    kind = Column(String, nullable=False)
+    value = Column(String, nullable=False)
+
+class MovieProvider(Base):
+    """
+    One row per (movie, region, provider type, provider id) from the watch
+    provider results in tmdb_data, e.g. ('US', 'flatrate', 8). Maintained by
+    triggers like MovieCountry so availability filters can use an index.
+    """
+    __tablename__ = "movie_providers"
+    __table_args__ = (Index("ix_movie_providers_region_type_provider", "region", "provider_type", "provider_id"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    movie_id = Column(Integer, ForeignKey("movies.id", ondelete="CASCADE"), index=True, nullable=False)
+    region = Column(String, nullable=False)
+    provider_type = Column(String, nullable=False)
+    provider_id = Column(Integer, nullable=False)
@@ -1,21 +1,22 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, Body, UploadFile, File, Form, BackgroundTasks
-from fastapi.responses import StreamingResponse, FileResponse, Response
-from sqlalchemy.orm import Session
-from sqlalchemy import Float, String, Integer, cast, func, or_, and_, text, case, not_
-from typing import Optional, Dict, List, Union, Any
-from database import get_db, get_tracked_list_names, filename_to_column_name, engine, SessionLocal
-from models import Movie, FavoriteDirector, SeenCountry
+from fastapi.responses import StreamingResponse, FileResponse
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy import event, Float, Integer, cast, func, or_, and_, text, case, not_, tuple_, exists, select, false, true, update, insert, bindparam, literal_column
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from typing import Optional, Dict, List, Tuple, Union, Any, Callable, BinaryIO
+from database import get_db, get_tracked_list_names, filename_to_column_name, engine, SessionLocal, search_index_available
+from models import Movie, FavoriteDirector, SeenCountry, MovieCountry, MovieSpokenLanguage, MoviePerson, MovieFacet, MovieProvider, TmdbJSON
 from csv_parser import parse_watchlist_csv
 from list_processor import process_all_tracked_lists, check_movie_in_tracked_lists, load_tracked_lists
-from tmdb_client import tmdb_client, extract_enriched_data_from_tmdb
+from tmdb_client import tmdb_client, extract_enriched_data_from_tmdb, enrich_movies_concurrently
 import logging
-import json
+import orjson
 import requests
 import asyncio
 import time
 from pathlib import Path
-from io import BytesIO
 from datetime import datetime
+from functools import lru_cache, wraps
 from utils import get_project_root
 
 logger = logging.getLogger(__name__)
@@ -26,127 +27,603 @@ router = APIRouter()
 PROJECT_ROOT = get_project_root()
 CSV_FILE_PATH = PROJECT_ROOT / "watchlist.csv"
 
+# Headers for text/event-stream progress responses. Content-Encoding is set
+# explicitly so GZipMiddleware passes the stream through untouched; gzip would
+# hold frames in its compressor buffer and stall the progress bar.
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",
+    "Content-Encoding": "identity"
+}
+
+# Preformatted progress frames for the CSV import streams. These fire once per
+# row, so skip building a dict and serializing JSON for a fixed shape.
+SSE_PROGRESS_FRAME = b'data: {"current": %d, "total": %d, "processed": %d, "skipped": %d, "done": false}\n\n'
+SSE_SELECTION_PROGRESS_FRAME = (
+    b'data: {"current": %d, "total": %d, "processed": %d, "skipped": %d, "removed": %d, "done": false}\n\n'
+)
+
+def sse_event(payload: Dict[str, Any]) -> bytes:
+    """Encode a variable-shape payload (errors, final results) as an SSE frame."""
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
+
+def read_csv_upload(file: UploadFile) -> BinaryIO:
+    """
+    Validate an uploaded CSV and return its spooled file, rewound, for the
+    parser to read directly rather than copying the upload into memory.
+    """
+    if not file.filename or not file.filename.endswith('.csv'):
+        raise HTTPException(status_code=400, detail="File must be a CSV file")
+    file.file.seek(0)
+    return file.file
+
+# Rows fetched per batch when scanning the whole movies table
+SCAN_BATCH_SIZE = 500
+
+# Max values bound into a single IN (...) clause
+IN_CLAUSE_CHUNK_SIZE = 500
+
+# Pending inserts/updates flushed together during CSV imports
+IMPORT_FLUSH_BATCH_SIZE = 500
+
+# CSV rows looked ahead when prefetching TMDB data concurrently during imports
+TMDB_PREFETCH_WINDOW = 32
+
 def json_extract_path(column, json_path: str):
     """Extract value from a JSON column using SQLite's json_extract."""
     return func.json_extract(column, json_path)
 
-def check_movie_availability(
-    movie_tmdb_data: Union[dict, str, None],
+# Country name aliases for matching seen countries across naming conventions
+COUNTRY_ALIASES = {
+    'UK': ('United Kingdom', 'UK'),
+    'United Kingdom': ('United Kingdom', 'UK'),
+    'USA': ('United States of America', 'USA', 'United States'),
+    'United States of America': ('United States of America', 'USA', 'United States'),
+    'United States': ('United States of America', 'USA', 'United States'),
+}
+
+def expand_country_aliases(country_names: List[str]) -> List[str]:
+    """Return the given country names plus their aliases, without duplicates."""
+    return list(dict.fromkeys(
+        alias
+        for country_name in country_names
+        for alias in COUNTRY_ALIASES.get(country_name, (country_name,))
+    ))
+
+def movie_country_filter(country_names: List[str]):
+    """
+    Match movies with any of the given countries (case-insensitive) via the
+    movie_countries table, which covers both the country column and every
+    tmdb_data.production_countries entry.
+    """
+    # lower() runs in SQLite on both sides so non-ASCII names compare consistently
+    return Movie.id.in_(
+        select(MovieCountry.movie_id).where(
+            MovieCountry.name_lower.in_([func.lower(name) for name in country_names])
+        )
+    )
+
+def movie_person_filter(role: str, names: List[str]):
+    """
+    Match movies crediting any of the given people in a role ('actor', 'writer'
+    or 'producer') via the movie_people table built from tmdb_data.credits.
+    """
+    return Movie.id.in_(
+        select(MoviePerson.movie_id).where(MoviePerson.role == role, MoviePerson.name.in_(names))
+    )
+
+@lru_cache(maxsize=128)
+def tracked_list_column(column_name: str):
+    """
+    Column expression for a tracked list flag (e.g. movies.is_imdb_t250). These
+    columns are added by migrations rather than declared on Movie; comparing
+    against this (instead of text() SQL) keeps the values as bound parameters.
+    column_name must come from get_tracked_list_names().
+    """
+    return literal_column(f"movies.{column_name}", Integer)
+
+# Release date from tmdb_data (more precise than year), falling back to the year
+RELEASE_DATE_SORT = func.coalesce(
+    func.json_extract(Movie.tmdb_data, '$.release_date'),
+    text("CAST(movies.year AS TEXT) || '-01-01'")
+)
+
+# SQL sort expression per listing sort field; built once so every request
+# reuses the same clause objects (and their cached compiled form)
+SORT_EXPRESSIONS = {
+    "title": Movie.title,
+    "year": RELEASE_DATE_SORT,
+    "runtime": Movie.runtime,
+    "director": Movie.director,
+    "country": Movie.country,
+    "original_language": Movie.original_language,
+    "production_company": func.coalesce(func.json_extract(Movie.tmdb_data, '$.production_companies[0].name'), ''),
+    "genres": func.coalesce(func.json_extract(Movie.genres, '$[0]'), ''),
+    "in_collection": Movie.in_collection,
+    "is_favorite": Movie.is_favorite,
+    "date_added": Movie.created_at,
+}
+
+def sort_expression(field: str):
+    """SQL sort expression for a listing sort field (tracked list flags included); release date by default."""
+    expression = SORT_EXPRESSIONS.get(field)
+    if expression is not None:
+        return expression
+    if field.startswith("is_") and field in get_tracked_list_names():
+        return tracked_list_column(field)
+    return RELEASE_DATE_SORT
+
+# Listing order when no sort is requested: newest release first, then title
+DEFAULT_LISTING_ORDER = (RELEASE_DATE_SORT.desc().nullslast(), Movie.title.asc().nullslast())
+
+def people_names(db: Session, role: str) -> List[str]:
+    """Sorted distinct names with a role ('actor', 'writer' or 'producer') in movie_people."""
+    names = db.query(MoviePerson.name).filter(
+        MoviePerson.role == role,
+        MoviePerson.name != ''
+    ).distinct().order_by(MoviePerson.name).all()
+    return [n[0] for n in names]
+
+def facet_values(db: Session, kind: str) -> List[str]:
+    """Sorted distinct values of a movie_facets kind ('genre' or 'production_company')."""
+    values = db.query(MovieFacet.value).filter(MovieFacet.kind == kind).distinct().order_by(MovieFacet.value).all()
+    return [v[0] for v in values]
+
+def movie_genre_entries():
+    """json_each over movies.genres, for joining one row per genre onto movies."""
+    return func.json_each(Movie.genres).table_valued('value').alias('genre')
+
+def json_array_filter(array, values: List[str]):
+    """
+    Match rows whose JSON array contains any of the given values, walking the
+    array with a single json_each.
+    """
+    elements = func.json_each(array).table_valued('value')
+    return exists(select(1).select_from(elements).where(elements.c.value.in_(values)))
+
+# Favorite directors and seen countries are read by every get_movies call that
+# filters on them but change rarely; the endpoints that edit them invalidate
+# their entry, and the TTL bounds staleness from writes made elsewhere
+NAME_LIST_TTL = 30.0
+_name_list_cache: Dict[str, Tuple[float, List[str]]] = {}
+
+def cached_name_list(db: Session, column) -> List[str]:
+    """Return every value of a name column (e.g. FavoriteDirector.director_name), cached for NAME_LIST_TTL seconds."""
+    key = column.class_.__tablename__
+    now = time.monotonic()
+    entry = _name_list_cache.get(key)
+    if entry and entry[0] > now:
+        return entry[1]
+    names = list(db.execute(select(column)).scalars())
+    _name_list_cache[key] = (now + NAME_LIST_TTL, names)
+    return names
+
+def invalidate_name_list(model) -> None:
+    _name_list_cache.pop(model.__tablename__, None)
+
+# Stats and the filter option lists are computed identically for every client
+# and only change when movies do. Any commit through the engine clears them
+# (covering imports, tracked list updates and raw SQL writes alike); the TTL
+# bounds staleness from writes made by other processes.
+# The engine "commit" event fires before the commit reaches SQLite, so a
+# summary computed in between would still see the old rows; session commits
+# clear the cache again once they have landed.
+MOVIE_SUMMARY_TTL = 300.0
+_movie_summary_cache: Dict[str, Tuple[float, Any]] = {}
+_movie_summary_generation = 0
+
+@event.listens_for(engine, "commit")
+@event.listens_for(SessionLocal, "after_commit")
+def invalidate_movie_summaries(connection_or_session) -> None:
+    global _movie_summary_generation
+    _movie_summary_generation += 1
+    _movie_summary_cache.clear()
+
+def cached_movie_summary(key: str):
+    """Cache an endpoint's response under key for MOVIE_SUMMARY_TTL seconds (until the next commit)."""
+    def decorator(endpoint: Callable) -> Callable:
+        @wraps(endpoint)
+        def wrapper(*args, **kwargs):
+            now = time.monotonic()
+            entry = _movie_summary_cache.get(key)
+            if entry and entry[0] > now:
+                return entry[1]
+            generation = _movie_summary_generation
+            result = endpoint(*args, **kwargs)
+            # A commit made while computing may have outdated the result
+            if generation == _movie_summary_generation:
+                _movie_summary_cache[key] = (now + MOVIE_SUMMARY_TTL, result)
+            return result
+        return wrapper
+    return decorator
+
+def search_fts_query(search_words: List[str]) -> Optional[str]:
+    """
+    Build a movies_fts MATCH expression requiring every word in the same column
+    (title, director or notes), mirroring the search LIKE filters. The trigram
+    tokenizer can't match words under 3 characters, so those are left to the
+    LIKE filters; returns None when no word is long enough to use the index.
+    """
+    phrases = ['"' + word.replace('"', '""') + '"' for word in search_words if len(word) >= 3]
+    if not phrases:
+        return None
+    all_words = " AND ".join(phrases)
+    return " OR ".join(f"{column} : ({all_words})" for column in ('title', 'director', 'notes'))
+
+def movie_provider_filter(region: str, provider_types, provider_ids: List[int]):
+    """
+    Match movies offered by any of the given providers, as any of the given
+    provider types, in a region, via the movie_providers table built from
+    tmdb_data's watch provider results.
+    """
+    return Movie.id.in_(
+        select(MovieProvider.movie_id).where(
+            MovieProvider.region == region,
+            MovieProvider.provider_type.in_(provider_types),
+            MovieProvider.provider_id.in_(provider_ids)
+        )
+    )
+
+def availability_filter_clause(
     country_code: str,
     preferred_services: List[int],
     availability_types: List[str]
-) -> bool:
+):
     """
-    Check if a movie matches any of the specified availability types for preferred services.
-    
-    Args:
-        movie_tmdb_data: Movie's tmdb_data (dict, JSON string, or None)
-        country_code: ISO 3166-1 country code (e.g., 'US')
-        preferred_services: List of preferred streaming service provider IDs
-        availability_types: List of availability types to check ('for_free', 'for_rent', 'to_buy', 'unavailable')
-    
-    Returns:
-        True if movie is available in ANY of the specified availability types for ANY preferred service.
+    WHERE clause matching movies available as any of availability_types
+    ('for_free' = flatrate or free, 'for_rent', 'to_buy') from a preferred
+    service in the region, so the list endpoint keeps COUNT + OFFSET/LIMIT.
+    Providers come from movie_providers, which reads 'watch.providers' over
+    the legacy 'watch/providers' key and decodes tmdb_data stored as a JSON
+    string. 'unavailable' matches movies no preferred service offers in the
+    region in any way, including those with no provider data for it, but
+    only when the movie has tmdb_data at all (Movie.has_tmdb_data).
+    """
+    types = set(availability_types)
+    preferred = [provider_id for provider_id in preferred_services if provider_id]
+    country = country_code.upper()
+    
+    checks = []
+    if 'for_free' in types:
+        checks.append(movie_provider_filter(country, ('flatrate', 'free'), preferred))
+    if 'for_rent' in types:
+        checks.append(movie_provider_filter(country, ('rent',), preferred))
+    if 'to_buy' in types:
+        checks.append(movie_provider_filter(country, ('buy',), preferred))
+    if 'unavailable' in types:
+        checks.append(and_(
+            Movie.has_tmdb_data == 1,
+            ~movie_provider_filter(country, ('flatrate', 'free', 'rent', 'buy'), preferred)
+        ))
+    return or_(*checks) if checks else false()
+
+# The tmdb_data fields the movie list shows (poster, language, first company,
+# collection), used by get_movies in place of the full blob
+LISTING_TMDB_FIELDS = ('poster_path', 'original_language', 'production_companies', 'belongs_to_collection')
+
+# Movie columns the movie list reads. Loading only these skips tmdb_data
+# (replaced by listing_tmdb_fields()) and the generated columns, which SQLite
+# would otherwise compute from tmdb_data for every row; anything else raises
+# instead of lazy-loading per movie.
+LISTING_COLUMNS = load_only(
+    Movie.id, Movie.title, Movie.year, Movie.letterboxd_uri, Movie.director, Movie.country,
+    Movie.runtime, Movie.genres, Movie.tmdb_id, Movie.is_favorite, Movie.seen_before,
+    Movie.notes, Movie.created_at,
+    raiseload=True
+)
+
+def tmdb_document():
+    """
+    SQLite expression for a movie's tmdb_data object, or NULL when there is no
+    usable tmdb_data. Like parse_tmdb_data(), legacy rows holding the object
+    as a JSON string are decoded first.
+    """
+    tmdb_data = Movie.tmdb_data
+    legacy_json = func.json_extract(tmdb_data, '$')
+    return case(
+        (func.json_valid(tmdb_data) != 1, None),
+        (func.json_type(tmdb_data) == 'object', tmdb_data),
+        (func.json_type(tmdb_data) != 'text', None),
+        (func.json_valid(legacy_json) != 1, None),
+        (func.json_type(legacy_json) == 'object', legacy_json),
+    )
+
+def listing_tmdb_fields():
+    """
+    SQLite expression giving a small JSON object with just LISTING_TMDB_FIELDS
+    from a movie's tmdb_data (see tmdb_document()), or NULL when there is no
+    usable tmdb_data. Typed as TmdbJSON, so the result loads as a dict.
+    """
+    doc = tmdb_document()
+    fields = []
+    for field in LISTING_TMDB_FIELDS:
+        fields += [field, func.json_extract(doc, f'$.{field}')]
+    return case((doc.isnot(None), func.json_object(*fields, type_=TmdbJSON)))
+
+def poster_url_w300(poster_path: Any) -> Optional[str]:
+    """List-size poster URL for a tmdb_data poster_path, or None when it is empty or 'none'."""
+    poster_path = str(poster_path).strip() if poster_path else ''
+    if not poster_path or poster_path.lower() == 'none':
+        return None
+    # Ensure poster_path starts with / if it doesn't already
+    if not poster_path.startswith('/'):
+        poster_path = '/' + poster_path
+    return f"https://image.tmdb.org/t/p/w300{poster_path}"
+
+def listing_tmdb_summary(tmdb_data: Optional[dict]) -> Tuple[Optional[str], Optional[str], Optional[str], bool]:
+    """
+    (poster_url, original_language, production_company, in_collection) for
+    the movie list from a movie's tmdb_data or listing_tmdb_fields() object.
+    production_company is the first company with a name.
+    """
+    if not tmdb_data or not isinstance(tmdb_data, dict):
+        return None, None, None, False
+    poster_path = tmdb_data.get('poster_path')
+    production_company = None
+    production_companies = tmdb_data.get('production_companies')
+    if production_companies and isinstance(production_companies, list):
+        production_company = next(
+            (company.get('name') for company in production_companies if isinstance(company, dict) and company.get('name')),
+            None
+        )
+    original_language = tmdb_data.get('original_language')
+    belongs_to_collection = tmdb_data.get('belongs_to_collection')
+    return (
+        poster_url_w300(poster_path),
+        None if original_language == '' else original_language,
+        production_company,
+        belongs_to_collection is not None and belongs_to_collection != ''
+    )
+
+def expand_listing_query(query, field: str):
     """
-    if not movie_tmdb_data or not preferred_services or not availability_types:
-        return False
-    
-    # Parse tmdb_data if it's a string
-    tmdb_data = movie_tmdb_data
-    if isinstance(tmdb_data, str):
+    Join each movie's genres or production company names onto a listing query
+    (one row per value, via json_each) for sorts that list a movie once per
+    value. Movies without any are kept once with a NULL value. Returns the
+    joined query and the value to sort by (empty strings count as NULL).
+    """
+    if field == 'genres':
+        entries = func.json_each(Movie.genres).table_valued('value', 'type').alias('expansion')
+        value = entries.c.value
+        join_on = true()
+    else:
+        doc = tmdb_document()
+        entries = func.json_each(doc, '$.production_companies').table_valued('value', 'type').alias('expansion')
+        value = func.json_extract(entries.c.value, '$.name')
+        join_on = and_(
+            func.json_type(doc, '$.production_companies') == 'array',
+            entries.c.type == 'object',
+            func.nullif(value, '').isnot(None)
+        )
+    return query.outerjoin(entries, join_on), func.nullif(value, '')
+
+# Secondary sort keys after an expansion sort; empty values sort last like NULLs
+EXPANSION_SORT_KEYS = {
+    'title': func.nullif(Movie.title, ''),
+    'year': Movie.year,
+    'runtime': Movie.runtime,
+    'director': func.nullif(Movie.director, ''),
+    'country': func.nullif(Movie.country, ''),
+    'original_language': func.nullif(func.json_extract(tmdb_document(), '$.original_language'), ''),
+    'production_company': func.nullif(func.json_extract(tmdb_document(), '$.production_companies[0].name'), ''),
+    'date_added': Movie.created_at,
+    'is_favorite': func.coalesce(Movie.is_favorite, False),
+    'in_collection': func.coalesce(func.json_extract(tmdb_document(), '$.belongs_to_collection'), '') != '',
+}
+
+@lru_cache(maxsize=4096)
+def _isoformat(value: datetime) -> str:
+    return value.isoformat()
+
+def format_date_added(created_at: Optional[Union[datetime, str]]) -> Optional[str]:
+    """Format a movie's created_at as an ISO string (memoized; many rows share timestamps)."""
+    if not created_at:
+        return None
+    if isinstance(created_at, str):
+        return created_at
+    return _isoformat(created_at)
+
+def build_movie_kwargs(title: str, year: int, letterboxd_uri: str, enriched_data: Optional[Dict], **extra) -> Dict[str, Any]:
+    """
+    Build the Movie constructor kwargs from CSV/request fields and enriched TMDB data.
+    Extra keyword arguments (is_favorite, notes, ...) are passed through unchanged.
+    """
+    movie_kwargs = {
+        'title': title,
+        'year': year,
+        'letterboxd_uri': letterboxd_uri,
+    }
+    if enriched_data:
+        get = enriched_data.get
+        movie_kwargs.update(
+            director=get('director'),
+            country=get('country'),
+            runtime=get('runtime'),
+            genres=get('genres'),
+            tmdb_id=get('tmdb_id'),
+            tmdb_data=get('tmdb_data'),
+        )
+    else:
+        movie_kwargs.update(director=None, country=None, runtime=None, genres=[], tmdb_id=None, tmdb_data=None)
+    movie_kwargs.update(extra)
+    return movie_kwargs
+
+# A movie matched during import: the key columns of a row already in the
+# database, or the queued insert values for one added earlier in the same CSV
+# (which only gains an 'id' once its batch has been written)
+ExistingMovie = Dict[str, Any]
+
+def load_existing_movies(
+    db: Session,
+    movies_data: List[Dict],
+    include_tmdb_data: bool = False
+) -> Tuple[Dict[str, ExistingMovie], Dict[Tuple[str, int], ExistingMovie]]:
+    """
+    Load movies matching the parsed CSV rows with a few chunked IN queries.
+    Returns (by_uri, by_title_year) maps so the import loop can do dict
+    lookups instead of up to three SELECTs per row. When several rows share
+    a title+year the lowest id wins, matching the old .first() lookups.
+    
+    Only the key columns are selected (plus tmdb_data on the title+year map
+    when include_tmdb_data is set, for reusing cached TMDB data), so no ORM
+    instances are built for the matched rows; each match is a plain dict.
+    """
+    uris = list({m['letterboxd_uri'] for m in movies_data if m.get('letterboxd_uri')})
+    title_years = list({(m['name'], m['year']) for m in movies_data})
+    
+    by_uri: Dict[str, ExistingMovie] = {}
+    for i in range(0, len(uris), IN_CLAUSE_CHUNK_SIZE):
+        chunk = uris[i:i + IN_CLAUSE_CHUNK_SIZE]
+        rows = db.query(Movie.id, Movie.letterboxd_uri).filter(Movie.letterboxd_uri.in_(chunk))
+        for row in rows:
+            by_uri[row.letterboxd_uri] = row._asdict()
+    
+    columns = [Movie.id, Movie.title, Movie.year]
+    if include_tmdb_data:
+        columns.append(Movie.tmdb_data)
+    by_title_year: Dict[Tuple[str, int], ExistingMovie] = {}
+    for i in range(0, len(title_years), IN_CLAUSE_CHUNK_SIZE):
+        chunk = title_years[i:i + IN_CLAUSE_CHUNK_SIZE]
+        rows = db.query(*columns).filter(tuple_(Movie.title, Movie.year).in_(chunk)).order_by(Movie.id)
+        for row in rows:
+            if (row.title, row.year) not in by_title_year:
+                by_title_year[(row.title, row.year)] = row._asdict()
+    
+    return by_uri, by_title_year
+
+@lru_cache(maxsize=8192)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO 8601 date string (cached; import rows often share dates)."""
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+def coerce_date_added(movie_data: Dict) -> Optional[datetime]:
+    """Return a parsed CSV row's date_added as a datetime, or None if missing or invalid."""
+    date_added = movie_data.get('date_added')
+    if not date_added:
+        return None
+    if isinstance(date_added, str):
         try:
-            tmdb_data = json.loads(tmdb_data)
-        except (json.JSONDecodeError, TypeError):
-            tmdb_data = {}
-    
-    if not isinstance(tmdb_data, dict):
+            return _parse_iso(date_added)
+        except ValueError as e:
+            logger.warning(f"Invalid date_added for {movie_data['name']}: {str(e)}")
+            return None
+    return date_added
+
+def set_existing_created_at(existing: ExistingMovie, created_at: datetime, pending_created_at: Dict[int, datetime]):
+    """Queue a created_at update for a matched movie (see flush_import_batch)."""
+    if 'id' in existing:
+        pending_created_at[existing['id']] = created_at
+    else:
+        # Added earlier in this import and not written yet
+        existing['created_at'] = created_at
+
+def insert_movies(db: Session, rows: List[Dict]):
+    """
+    Insert new movies in bulk and record each row's id on its dict.
+    On SQLite this is INSERT ... ON CONFLICT (letterboxd_uri): a row that
+    appeared since the import's existence check is not duplicated, and only
+    gets its created_at replaced when the CSV supplied one.
+    """
+    rows_by_uri = {row['letterboxd_uri']: row for row in rows}
+    dated = [row for row in rows if 'created_at' in row]
+    undated = [row for row in rows if 'created_at' not in row]
+    for batch in (dated, undated):
+        if not batch:
+            continue
+        if db.bind.dialect.name == 'sqlite':
+            stmt = sqlite_insert(Movie)
+            if batch is dated:
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[Movie.letterboxd_uri],
+                    set_={'created_at': stmt.excluded.created_at}
+                )
+            else:
+                stmt = stmt.on_conflict_do_nothing(index_elements=[Movie.letterboxd_uri])
+        else:
+            stmt = insert(Movie)
+        for row in db.execute(stmt.returning(Movie.id, Movie.letterboxd_uri), batch):
+            rows_by_uri[row.letterboxd_uri]['id'] = row.id
+
+def flush_import_batch(db: Session, pending_inserts: List[Dict], pending_created_at: Dict[int, datetime]):
+    """Write queued new movies, then queued created_at updates as one bulk UPDATE by primary key."""
+    if pending_inserts:
+        insert_movies(db, pending_inserts)
+        pending_inserts.clear()
+    if pending_created_at:
+        db.execute(
+            update(Movie),
+            [{'id': movie_id, 'created_at': created_at} for movie_id, created_at in pending_created_at.items()]
+        )
+        pending_created_at.clear()
+
+def prefetch_tmdb_data(title_years: List[Tuple[str, int]]) -> Dict[Tuple[str, int], Optional[Dict]]:
+    """
+    Fetch TMDB enrichment for several (title, year) pairs concurrently.
+    Lookups that fail are logged and stored as None, like a TMDB miss.
+    """
+    prefetched: Dict[Tuple[str, int], Optional[Dict]] = {}
+    if not tmdb_client or not title_years:
+        return prefetched
+    for index, enriched_data, error in enrich_movies_concurrently(tmdb_client, title_years):
+        title, year = title_years[index]
+        if error is not None:
+            logger.warning(f"Error fetching TMDB data for {title} ({year}): {str(error)}")
+        prefetched[title_years[index]] = enriched_data
+    return prefetched
+
+class ProgressThrottle:
+    """
+    Rate-limits streaming progress updates so fast imports don't flood the
+    client with one SSE frame per row. An update is due once progress has
+    advanced by ~0.5% of the total or min_interval seconds have passed.
+    Initial and final frames are always sent by the caller; this only gates
+    the intermediate ones.
+    """
+    def __init__(self, total: int, min_interval: float = 0.1, steps: int = 200):
+        self.min_interval = min_interval
+        self.min_step = max(1, total // steps)
+        self.last_emit = time.monotonic()
+        self.last_position = 0
+
+    def ready(self, position: int) -> bool:
+        now = time.monotonic()
+        if position - self.last_position >= self.min_step or now - self.last_emit >= self.min_interval:
+            self.last_emit = now
+            self.last_position = position
+            return True
         return False
-    
-    # Extract watch/providers data (same logic as get_movie_streaming)
-    watch_providers = tmdb_data.get('watch', {}).get('providers', {})
-    if not watch_providers:
-        # Try alternative structure
-        watch_providers = tmdb_data.get('watch/providers', {})
-    
-    if not watch_providers:
-        # No watch provider data - only matches if 'unavailable' is requested
-        return 'unavailable' in availability_types
-    
-    results = watch_providers.get('results', {})
-    country_providers = results.get(country_code.upper(), {})
-    
-    if not country_providers:
-        # No data for this country - only matches if 'unavailable' is requested
-        return 'unavailable' in availability_types
-    
-    # Extract provider IDs by type
-    flatrate_providers = [p.get('provider_id') for p in country_providers.get('flatrate', []) if p.get('provider_id')]
-    free_providers = [p.get('provider_id') for p in country_providers.get('free', []) if p.get('provider_id')]
-    rent_providers = [p.get('provider_id') for p in country_providers.get('rent', []) if p.get('provider_id')]
-    buy_providers = [p.get('provider_id') for p in country_providers.get('buy', []) if p.get('provider_id')]
-    
-    # Check each availability type
-    for avail_type in availability_types:
-        if avail_type == 'for_free':
-            # Check if any preferred service is in flatrate or free
-            for provider_id in preferred_services:
-                if provider_id in flatrate_providers or provider_id in free_providers:
-                    return True
-        
-        elif avail_type == 'for_rent':
-            # Check if any preferred service is in rent
-            for provider_id in preferred_services:
-                if provider_id in rent_providers:
-                    return True
-        
-        elif avail_type == 'to_buy':
-            # Check if any preferred service is in buy
-            for provider_id in preferred_services:
-                if provider_id in buy_providers:
-                    return True
-        
-        elif avail_type == 'unavailable':
-            # Movie is unavailable if NONE of the preferred services are available in any type
-            any_service_available = False
-            for provider_id in preferred_services:
-                if (provider_id in flatrate_providers or 
-                    provider_id in free_providers or 
-                    provider_id in rent_providers or 
-                    provider_id in buy_providers):
-                    any_service_available = True
-                    break
-            
-            if not any_service_available:
-                return True
-    
-    return False
 
-async def process_csv_stream(db: Session, csv_file: Optional[Union[Path, BytesIO]] = None):
+def process_csv_stream(db: Session, csv_file: Optional[Union[Path, BinaryIO]] = None):
     """
     Generator function that processes CSV and yields progress updates.
     
+    This is deliberately a plain (sync) generator: StreamingResponse iterates
+    it in the threadpool, so the blocking database and TMDB calls between
+    frames never stall the event loop.
+    
     Args:
         db: Database session
-        csv_file: Optional CSV file to process. Can be a Path (for local file) or BytesIO (for uploaded file).
+        csv_file: Optional CSV file to process. Can be a Path (for local file) or a binary file object (for uploaded file).
                   If None, uses the default CSV_FILE_PATH.
     """
     # Determine which file to use
     if csv_file is None:
         # Use local file path (existing behavior)
         if not CSV_FILE_PATH.exists():
-            yield f"data: {json.dumps({'error': f'CSV file not found at {CSV_FILE_PATH}', 'done': True})}\n\n"
+            yield sse_event({'error': f'CSV file not found at {CSV_FILE_PATH}', 'done': True})
             return
         file_source = str(CSV_FILE_PATH)
         logger.info(f"Processing local CSV file: {CSV_FILE_PATH}")
     else:
-        # Use provided file (either Path or BytesIO)
-        if isinstance(csv_file, BytesIO):
+        # Use provided file (either Path or file object)
+        if not isinstance(csv_file, Path):
             file_source = csv_file
             logger.info("Processing uploaded CSV file")
         else:
             # It's a Path object
             if not csv_file.exists():
-                yield f"data: {json.dumps({'error': f'CSV file not found at {csv_file}', 'done': True})}\n\n"
+                yield sse_event({'error': f'CSV file not found at {csv_file}', 'done': True})
                 return
             file_source = str(csv_file)
             logger.info(f"Processing CSV file: {csv_file}")
@@ -165,24 +642,37 @@ async def process_csv_stream(db: Session, csv_file: Optional[Union[Path, BytesIO
         total_work = total_movies
         
         # Send initial progress
-        yield f"data: {json.dumps({'current': 0, 'total': total_work, 'processed': 0, 'skipped': 0, 'done': False})}\n\n"
+        yield SSE_PROGRESS_FRAME % (0, total_work, 0, 0)
         
         # Process each movie
         processed = 0
         skipped = 0
+        throttle = ProgressThrottle(total_work)
+        
+        # Resolve existing movies up front instead of querying per row
+        existing_by_uri, existing_by_title_year = load_existing_movies(db, movies_data)
+        pending_inserts: List[Dict] = []
+        pending_created_at: Dict[int, datetime] = {}
+        prefetched: Dict[Tuple[str, int], Optional[Dict]] = {}
         
         for index, movie_data in enumerate(movies_data):
+            title_year = (movie_data['name'], movie_data['year'])
+            
+            # Fetch TMDB data for the next window of new movies concurrently
+            if tmdb_client and index % TMDB_PREFETCH_WINDOW == 0:
+                prefetched.update(prefetch_tmdb_data(list({
+                    (m['name'], m['year'])
+                    for m in movies_data[index:index + TMDB_PREFETCH_WINDOW]
+                    if m['letterboxd_uri'] not in existing_by_uri
+                    and (m['name'], m['year']) not in existing_by_title_year
+                })))
+            
             # Check if movie already exists by letterboxd_uri
-            existing = db.query(Movie).filter(
-                Movie.letterboxd_uri == movie_data['letterboxd_uri']
-            ).first()
+            existing = existing_by_uri.get(movie_data['letterboxd_uri'])
             
             # Also check for existing movie by title+year to prevent duplicates
             if not existing:
-                existing = db.query(Movie).filter(
-                    Movie.title == movie_data['name'],
-                    Movie.year == movie_data['year']
-                ).first()
+                existing = existing_by_title_year.get(title_year)
                 if existing:
                     logger.info(f"Movie {movie_data['name']} ({movie_data['year']}) already exists with different URI, skipping duplicate")
             
@@ -190,35 +680,25 @@ async def process_csv_stream(db: Session, csv_file: Optional[Union[Path, BytesIO
                 logger.info(f"Movie {movie_data['name']} already exists, updating date_added and checking tracked lists")
                 
                 # Update date_added (created_at) if provided in CSV
-                if 'date_added' in movie_data and movie_data['date_added']:
-                    try:
-                        date_from_csv = movie_data['date_added']
-                        # Ensure it's a datetime object
-                        if isinstance(date_from_csv, str):
-                            date_from_csv = datetime.fromisoformat(date_from_csv.replace('Z', '+00:00'))
-                        existing.created_at = date_from_csv
-                        logger.info(f"Updated created_at for {movie_data['name']} to {date_from_csv}")
-                    except Exception as e:
-                        logger.warning(f"Error updating date_added for {movie_data['name']}: {str(e)}")
+                date_from_csv = coerce_date_added(movie_data)
+                if date_from_csv:
+                    set_existing_created_at(existing, date_from_csv, pending_created_at)
+                    logger.info(f"Updated created_at for {movie_data['name']} to {date_from_csv}")
                 
-                db.flush()  # Flush any changes
                 skipped += 1
                 current = index + 1
-                yield f"data: {json.dumps({'current': current, 'total': total_work, 'processed': processed, 'skipped': skipped, 'done': False})}\n\n"
+                if current % IMPORT_FLUSH_BATCH_SIZE == 0:
+                    flush_import_batch(db, pending_inserts, pending_created_at)
+                if throttle.ready(current):
+                    yield SSE_PROGRESS_FRAME % (current, total_work, processed, skipped)
                 continue
             
-            # Check cache for TMDB data by title and year
-            cached_movie = db.query(Movie).filter(
-                Movie.title == movie_data['name'],
-                Movie.year == movie_data['year']
-            ).first()
-            
+            # A title+year match would already have been handled as existing above,
+            # so there is no cached TMDB data to reuse here
             enriched_data = None
             
-            # If we have cached TMDB data, use it
-            if cached_movie and cached_movie.tmdb_data:
-                logger.info(f"Using cached TMDB data for {movie_data['name']} ({movie_data['year']})")
-                enriched_data = extract_enriched_data_from_tmdb(cached_movie.tmdb_data)
+            if title_year in prefetched:
+                enriched_data = prefetched[title_year]
             elif tmdb_client:
                 # No cache found, fetch from TMDB API
                 logger.info(f"Fetching TMDB data for {movie_data['name']} ({movie_data['year']})")
@@ -228,43 +708,34 @@ async def process_csv_stream(db: Session, csv_file: Optional[Union[Path, BytesIO
                 )
             
             # Create movie record with date_added if provided
-            movie_kwargs = {
-                'title': movie_data['name'],
-                'year': movie_data['year'],
-                'letterboxd_uri': movie_data['letterboxd_uri'],
-                'director': enriched_data.get('director') if enriched_data else None,
-                'country': enriched_data.get('country') if enriched_data else None,
-                'runtime': enriched_data.get('runtime') if enriched_data else None,
-                'genres': enriched_data.get('genres') if enriched_data else [],
-                'tmdb_id': enriched_data.get('tmdb_id') if enriched_data else None,
-                'tmdb_data': enriched_data.get('tmdb_data') if enriched_data else None
-            }
+            movie_kwargs = build_movie_kwargs(
+                movie_data['name'], movie_data['year'], movie_data['letterboxd_uri'], enriched_data
+            )
             
             # Set created_at if date_added is provided in CSV
-            if 'date_added' in movie_data and movie_data['date_added']:
-                try:
-                    date_from_csv = movie_data['date_added']
-                    # Ensure it's a datetime object
-                    if isinstance(date_from_csv, str):
-                        date_from_csv = datetime.fromisoformat(date_from_csv.replace('Z', '+00:00'))
-                    movie_kwargs['created_at'] = date_from_csv
-                    logger.info(f"Setting created_at for new movie {movie_data['name']} to {date_from_csv}")
-                except Exception as e:
-                    logger.warning(f"Error setting date_added for new movie {movie_data['name']}: {str(e)}")
-            
-            movie = Movie(**movie_kwargs)
+            date_from_csv = coerce_date_added(movie_data)
+            if date_from_csv:
+                movie_kwargs['created_at'] = date_from_csv
+                logger.info(f"Setting created_at for new movie {movie_data['name']} to {date_from_csv}")
             
-            db.add(movie)
-            db.flush()  # Flush to get the movie ID
+            pending_inserts.append(movie_kwargs)
+            # Later duplicate rows in the same CSV should see this movie
+            existing_by_uri[movie_kwargs['letterboxd_uri']] = movie_kwargs
+            existing_by_title_year.setdefault(title_year, movie_kwargs)
             
             processed += 1
             
-            # Send progress update after each movie
+            # Send progress update (throttled)
             # Progress includes movies processed so far (tracked lists will be added after)
             current = index + 1
-            yield f"data: {json.dumps({'current': current, 'total': total_work, 'processed': processed, 'skipped': skipped, 'done': False})}\n\n"
+            # Write queued rows in batches; tracked lists only need them after commit
+            if current % IMPORT_FLUSH_BATCH_SIZE == 0:
+                flush_import_batch(db, pending_inserts, pending_created_at)
+            if throttle.ready(current):
+                yield SSE_PROGRESS_FRAME % (current, total_work, processed, skipped)
         
         # Commit all changes (including updates to existing movies' date_added)
+        flush_import_batch(db, pending_inserts, pending_created_at)
         db.commit()
         logger.info(f"Committed changes: {processed} new movies, {skipped} existing movies (dates updated if provided in CSV)")
         
@@ -292,26 +763,27 @@ async def process_csv_stream(db: Session, csv_file: Optional[Union[Path, BytesIO
             # Don't fail the entire CSV processing if tracked lists processing fails
         
         # Send final result - all work is complete
-        yield f"data: {json.dumps({'current': total_work, 'total': total_work, 'processed': processed, 'skipped': skipped, 'done': True, 'message': 'CSV processed successfully'})}\n\n"
+        yield sse_event({'current': total_work, 'total': total_work, 'processed': processed, 'skipped': skipped, 'done': True, 'message': 'CSV processed successfully'})
     
     except Exception as e:
         db.rollback()
         logger.error(f"Error processing CSV: {str(e)}", exc_info=True)
-        yield f"data: {json.dumps({'error': f'Error processing CSV: {str(e)}', 'done': True})}\n\n"
+        yield sse_event({'error': f'Error processing CSV: {str(e)}', 'done': True})
 
 
-async def process_csv_with_selections_stream(
+def process_csv_with_selections_stream(
     db: Session,
-    csv_file: BytesIO,
+    csv_file: BinaryIO,
     selections: Dict[str, Any]
 ):
     """
     Generator function that processes CSV with user selections.
     Only processes selected movies to add and removes selected movies.
+    Sync for the same reason as process_csv_stream (runs in the threadpool).
     
     Args:
         db: Database session
-        csv_file: CSV file as BytesIO
+        csv_file: CSV file object (the upload's spooled file)
         selections: Dict with 'movies_to_add' (list) and 'movies_to_remove_ids' (list of IDs)
     """
     try:
@@ -345,27 +817,30 @@ async def process_csv_with_selections_stream(
         skipped = 0
         
         # Send initial progress
-        yield f"data: {json.dumps({'current': 0, 'total': total, 'processed': 0, 'skipped': 0, 'done': False, 'removed': 0})}\n\n"
+        yield SSE_SELECTION_PROGRESS_FRAME % (0, total, 0, 0, 0)
+        throttle = ProgressThrottle(total)
         
         # First, handle removals
         if movies_to_remove_ids:
             logger.info(f"Removing {len(movies_to_remove_ids)} movies")
-            for movie_id in movies_to_remove_ids:
+            remove_ids = list(movies_to_remove_ids)
+            # One DELETE ... WHERE id IN (...) per chunk, with progress between chunks
+            for i in range(0, len(remove_ids), IN_CLAUSE_CHUNK_SIZE):
+                chunk = remove_ids[i:i + IN_CLAUSE_CHUNK_SIZE]
                 try:
-                    movie = db.query(Movie).filter(Movie.id == movie_id).first()
-                    if movie:
-                        db.delete(movie)
-                        processed_remove += 1
-                        logger.info(f"Deleted movie {movie_id}: {movie.title}")
-                    else:
-                        logger.warning(f"Movie {movie_id} not found for deletion")
-                        skipped += 1
+                    deleted = db.query(Movie).filter(Movie.id.in_(chunk)).delete(synchronize_session=False)
+                    processed_remove += deleted
+                    skipped += len(chunk) - deleted
+                    logger.info(f"Deleted {deleted} movies")
+                    if deleted < len(chunk):
+                        logger.warning(f"{len(chunk) - deleted} movies not found for deletion")
                 except Exception as e:
-                    logger.error(f"Error deleting movie {movie_id}: {str(e)}")
-                    skipped += 1
+                    logger.error(f"Error deleting movies: {str(e)}")
+                    skipped += len(chunk)
                 
                 current = processed_add + processed_remove + skipped
-                yield f"data: {json.dumps({'current': current, 'total': total, 'processed': processed_add, 'skipped': skipped, 'removed': processed_remove, 'done': False})}\n\n"
+                if throttle.ready(current):
+                    yield SSE_SELECTION_PROGRESS_FRAME % (current, total, processed_add, skipped, processed_remove)
         
         # Commit removals before processing additions
         db.commit()
@@ -378,20 +853,39 @@ async def process_csv_with_selections_stream(
             
             # Send final result - total here is just removals (no tracked lists)
             final_total = total_remove
-            yield f"data: {json.dumps({'current': final_total, 'total': final_total, 'processed': processed_add, 'skipped': skipped, 'removed': processed_remove, 'done': True, 'message': f'Removed {processed_remove} movies'})}\n\n"
+            yield sse_event({'current': final_total, 'total': final_total, 'processed': processed_add, 'skipped': skipped, 'removed': processed_remove, 'done': True, 'message': f'Removed {processed_remove} movies'})
             return
         
         # Parse CSV to get all movie data
         csv_file.seek(0)  # Reset file pointer
         all_movies_data = parse_watchlist_csv(csv_file)
         
+        # Only selected movies are processed, so only look those up
+        selected_movies_data = [
+            movie_data for movie_data in all_movies_data
+            if movie_data['letterboxd_uri'] in movies_to_add_map
+        ]
+        existing_by_uri, existing_by_title_year = load_existing_movies(
+            db, selected_movies_data, include_tmdb_data=True
+        )
+        pending_inserts: List[Dict] = []
+        pending_created_at: Dict[int, datetime] = {}
+        prefetched: Dict[Tuple[str, int], Optional[Dict]] = {}
+        
         # Process only selected movies to add
-        for movie_data in all_movies_data:
+        for index, movie_data in enumerate(selected_movies_data):
             uri = movie_data['letterboxd_uri']
+            title_year = (movie_data['name'], movie_data['year'])
             
-            # Skip if not in selections
-            if uri not in movies_to_add_map:
-                continue
+            # Fetch TMDB data for the next window of uncached movies concurrently
+            if tmdb_client and index % TMDB_PREFETCH_WINDOW == 0:
+                window = selected_movies_data[index:index + TMDB_PREFETCH_WINDOW]
+                prefetched.update(prefetch_tmdb_data(list({
+                    (m['name'], m['year'])
+                    for m in window
+                    if m['letterboxd_uri'] not in existing_by_uri
+                    and not existing_by_title_year.get((m['name'], m['year']), {}).get('tmdb_data')
+                })))
             
             selected_movie = movies_to_add_map[uri]
             # Ensure is_favorite is properly read (can be bool or string representation)
@@ -403,42 +897,35 @@ async def process_csv_with_selections_stream(
             logger.info(f"Movie {movie_data['name']}: is_favorite={is_favorite} (from selection: {is_favorite_value}), seen_before={seen_before} (from selection: {seen_before_value})")
             
             # Check if movie already exists (shouldn't happen, but be safe)
-            existing = db.query(Movie).filter(
-                Movie.letterboxd_uri == uri
-            ).first()
+            existing = existing_by_uri.get(uri)
             
             if existing:
                 logger.info(f"Movie {movie_data['name']} already exists, updating date_added")
                 
                 # Update date_added (created_at) if provided in CSV
-                if 'date_added' in movie_data and movie_data['date_added']:
-                    try:
-                        date_from_csv = movie_data['date_added']
-                        # Ensure it's a datetime object
-                        if isinstance(date_from_csv, str):
-                            date_from_csv = datetime.fromisoformat(date_from_csv.replace('Z', '+00:00'))
-                        existing.created_at = date_from_csv
-                        logger.info(f"Updated created_at for {movie_data['name']} to {date_from_csv}")
-                    except Exception as e:
-                        logger.warning(f"Error updating date_added for {movie_data['name']}: {str(e)}")
+                date_from_csv = coerce_date_added(movie_data)
+                if date_from_csv:
+                    set_existing_created_at(existing, date_from_csv, pending_created_at)
+                    logger.info(f"Updated created_at for {movie_data['name']} to {date_from_csv}")
                 
-                db.flush()  # Flush any changes
                 skipped += 1
                 current = processed_add + processed_remove + skipped
-                yield f"data: {json.dumps({'current': current, 'total': total, 'processed': processed_add, 'skipped': skipped, 'removed': processed_remove, 'done': False})}\n\n"
+                if current % IMPORT_FLUSH_BATCH_SIZE == 0:
+                    flush_import_batch(db, pending_inserts, pending_created_at)
+                if throttle.ready(current):
+                    yield SSE_SELECTION_PROGRESS_FRAME % (current, total, processed_add, skipped, processed_remove)
                 continue
             
             # Check cache for TMDB data
-            cached_movie = db.query(Movie).filter(
-                Movie.title == movie_data['name'],
-                Movie.year == movie_data['year']
-            ).first()
+            cached_movie = existing_by_title_year.get(title_year)
             
             enriched_data = None
             
-            if cached_movie and cached_movie.tmdb_data:
+            if cached_movie and cached_movie.get('tmdb_data'):
                 logger.info(f"Using cached TMDB data for {movie_data['name']} ({movie_data['year']})")
-                enriched_data = extract_enriched_data_from_tmdb(cached_movie.tmdb_data)
+                enriched_data = extract_enriched_data_from_tmdb(cached_movie['tmdb_data'])
+            elif title_year in prefetched:
+                enriched_data = prefetched[title_year]
             elif tmdb_client:
                 logger.info(f"Fetching TMDB data for {movie_data['name']} ({movie_data['year']})")
                 enriched_data = tmdb_client.enrich_movie_data(
@@ -447,43 +934,32 @@ async def process_csv_with_selections_stream(
                 )
             
             # Create movie record with favorite status, and date_added if provided
-            movie_kwargs = {
-                'title': movie_data['name'],
-                'year': movie_data['year'],
-                'letterboxd_uri': movie_data['letterboxd_uri'],
-                'director': enriched_data.get('director') if enriched_data else None,
-                'country': enriched_data.get('country') if enriched_data else None,
-                'runtime': enriched_data.get('runtime') if enriched_data else None,
-                'genres': enriched_data.get('genres') if enriched_data else [],
-                'tmdb_id': enriched_data.get('tmdb_id') if enriched_data else None,
-                'tmdb_data': enriched_data.get('tmdb_data') if enriched_data else None,
-                'is_favorite': is_favorite,  # Apply favorite status from selections
-                'seen_before': seen_before  # Apply seen_before status from selections
-            }
+            movie_kwargs = build_movie_kwargs(
+                movie_data['name'], movie_data['year'], movie_data['letterboxd_uri'], enriched_data,
+                is_favorite=is_favorite,  # Apply favorite status from selections
+                seen_before=seen_before  # Apply seen_before status from selections
+            )
             
             # Set created_at if date_added is provided in CSV
-            if 'date_added' in movie_data and movie_data['date_added']:
-                try:
-                    date_from_csv = movie_data['date_added']
-                    # Ensure it's a datetime object
-                    if isinstance(date_from_csv, str):
-                        date_from_csv = datetime.fromisoformat(date_from_csv.replace('Z', '+00:00'))
-                    movie_kwargs['created_at'] = date_from_csv
-                    logger.info(f"Setting created_at for new movie {movie_data['name']} to {date_from_csv}")
-                except Exception as e:
-                    logger.warning(f"Error setting date_added for new movie {movie_data['name']}: {str(e)}")
+            date_from_csv = coerce_date_added(movie_data)
+            if date_from_csv:
+                movie_kwargs['created_at'] = date_from_csv
+                logger.info(f"Setting created_at for new movie {movie_data['name']} to {date_from_csv}")
             
-            movie = Movie(**movie_kwargs)
-            
-            db.add(movie)
-            db.flush()
+            pending_inserts.append(movie_kwargs)
+            existing_by_uri[uri] = movie_kwargs
+            existing_by_title_year.setdefault(title_year, movie_kwargs)
             
             processed_add += 1
             # Progress includes movies processed so far (tracked lists will be added after)
             current = processed_add + processed_remove + skipped
-            yield f"data: {json.dumps({'current': current, 'total': total, 'processed': processed_add, 'skipped': skipped, 'removed': processed_remove, 'done': False})}\n\n"
+            if current % IMPORT_FLUSH_BATCH_SIZE == 0:
+                flush_import_batch(db, pending_inserts, pending_created_at)
+            if throttle.ready(current):
+                yield SSE_SELECTION_PROGRESS_FRAME % (current, total, processed_add, skipped, processed_remove)
         
         # Commit all changes (including updates to existing movies' date_added)
+        flush_import_batch(db, pending_inserts, pending_created_at)
         db.commit()
         logger.info(f"Committed changes: {processed_add} new movies added, {processed_remove} movies removed, {skipped} existing movies (dates updated if provided in CSV)")
         
@@ -501,12 +977,12 @@ async def process_csv_with_selections_stream(
             logger.warning(f"Error processing tracked lists: {str(e)} - continuing anyway")
         
         # Send final result - all work is complete
-        yield f"data: {json.dumps({'current': total, 'total': total, 'processed': processed_add, 'skipped': skipped, 'removed': processed_remove, 'done': True, 'message': f'Added {processed_add} movies, removed {processed_remove} movies'})}\n\n"
+        yield sse_event({'current': total, 'total': total, 'processed': processed_add, 'skipped': skipped, 'removed': processed_remove, 'done': True, 'message': f'Added {processed_add} movies, removed {processed_remove} movies'})
     
     except Exception as e:
         db.rollback()
         logger.error(f"Error processing CSV with selections: {str(e)}", exc_info=True)
-        yield f"data: {json.dumps({'error': f'Error processing CSV: {str(e)}', 'done': True})}\n\n"
+        yield sse_event({'error': f'Error processing CSV: {str(e)}', 'done': True})
 
 
 @router.post("/api/upload")
@@ -517,11 +993,7 @@ async def process_csv(db: Session = Depends(get_db)):
     return StreamingResponse(
         process_csv_stream(db),
         media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no"
-        }
+        headers=SSE_HEADERS
     )
 
 @router.options("/api/preview-csv")
@@ -530,38 +1002,37 @@ async def preview_csv_options():
     return {"message": "OK"}
 
 @router.post("/api/preview-csv")
-async def preview_csv(file: UploadFile = File(...), db: Session = Depends(get_db)):
+def preview_csv(file: UploadFile = File(...), db: Session = Depends(get_db)):
     """
     Preview CSV import - identifies movies to add and movies to remove.
     Returns preview data without making any changes to the database.
+    A plain def so the parsing and queries run in the threadpool instead of
+    blocking the event loop.
     """
-    # Validate file type
-    if not file.filename or not file.filename.endswith('.csv'):
-        raise HTTPException(status_code=400, detail="File must be a CSV file")
-    
-    # Read the uploaded file into BytesIO
-    try:
-        contents = await file.read()
-        csv_file = BytesIO(contents)
-    except Exception as e:
-        logger.error(f"Error reading uploaded file: {str(e)}", exc_info=True)
-        raise HTTPException(status_code=400, detail=f"Error reading file: {str(e)}")
+    csv_file = read_csv_upload(file)
     
     try:
         # Parse CSV
         movies_data = parse_watchlist_csv(csv_file)
         
-        # Get all existing movies from database (only URI and basic info)
-        existing_movies = db.query(
-            Movie.id,
-            Movie.title,
-            Movie.year,
-            Movie.letterboxd_uri
-        ).all()
-        
-        # Create sets for fast lookup
-        csv_uris = {movie['letterboxd_uri'] for movie in movies_data}
-        existing_uris = {movie.letterboxd_uri for movie in existing_movies if movie.letterboxd_uri}
+        # Diff against the database in SQL: load the CSV URIs into a temp table
+        # so neither side of the comparison has to be pulled into Python in full
+        csv_uris = {movie['letterboxd_uri'] for movie in movies_data if movie['letterboxd_uri']}
+        db.execute(text("CREATE TEMP TABLE IF NOT EXISTS _csv_uris (uri TEXT PRIMARY KEY)"))
+        db.execute(text("DELETE FROM _csv_uris"))
+        if csv_uris:
+            db.execute(text("INSERT INTO _csv_uris (uri) VALUES (:uri)"), [{"uri": uri} for uri in csv_uris])
+        
+        existing_uris = set(db.execute(text(
+            "SELECT letterboxd_uri FROM movies WHERE letterboxd_uri IN (SELECT uri FROM _csv_uris)"
+        )).scalars())
+        removed_rows = db.execute(text(
+            "SELECT id, title, year, letterboxd_uri FROM movies "
+            "WHERE letterboxd_uri != '' AND letterboxd_uri NOT IN (SELECT uri FROM _csv_uris) "
+            "ORDER BY id"
+        )).all()
+        # Preview never writes; discard the temp rows with the read transaction
+        db.rollback()
         
         # Find movies to add (in CSV but not in DB)
         movies_to_add = [
@@ -584,8 +1055,7 @@ async def preview_csv(file: UploadFile = File(...), db: Session = Depends(get_db
                 "letterboxd_uri": movie.letterboxd_uri,
                 "action": "keep"  # Default action
             }
-            for movie in existing_movies
-            if movie.letterboxd_uri and movie.letterboxd_uri not in csv_uris
+            for movie in removed_rows
         ]
         
         return {
@@ -614,36 +1084,22 @@ async def process_csv_with_selections(
     Process CSV with user selections (movies to add, movies to remove).
     Accepts a CSV file and a JSON string with selections from FormData.
     """
-    # Validate file type
-    if not file.filename or not file.filename.endswith('.csv'):
-        raise HTTPException(status_code=400, detail="File must be a CSV file")
+    csv_file = read_csv_upload(file)
     
     # Parse selections JSON
     try:
-        selections_dict = json.loads(selections)
-    except json.JSONDecodeError as e:
+        selections_dict = orjson.loads(selections)
+    except orjson.JSONDecodeError as e:
         raise HTTPException(status_code=400, detail=f"Invalid selections JSON: {str(e)}")
     
     # Validate selections structure
     if not isinstance(selections_dict, dict):
         raise HTTPException(status_code=400, detail="Selections must be a JSON object")
     
-    # Read the uploaded file into BytesIO
-    try:
-        contents = await file.read()
-        csv_file = BytesIO(contents)
-    except Exception as e:
-        logger.error(f"Error reading uploaded file: {str(e)}", exc_info=True)
-        raise HTTPException(status_code=400, detail=f"Error reading file: {str(e)}")
-    
     return StreamingResponse(
         process_csv_with_selections_stream(db, csv_file=csv_file, selections=selections_dict),
         media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no"
-        }
+        headers=SSE_HEADERS
     )
 
 
@@ -652,85 +1108,92 @@ async def upload_csv(file: UploadFile = File(...), db: Session = Depends(get_db)
     """
     Upload and process a CSV file with progress streaming.
     """
-    # Validate file type
-    if not file.filename or not file.filename.endswith('.csv'):
-        raise HTTPException(status_code=400, detail="File must be a CSV file")
-    
-    # Read the uploaded file into BytesIO
-    try:
-        contents = await file.read()
-        csv_file = BytesIO(contents)
-    except Exception as e:
-        logger.error(f"Error reading uploaded file: {str(e)}", exc_info=True)
-        raise HTTPException(status_code=400, detail=f"Error reading file: {str(e)}")
+    csv_file = read_csv_upload(file)
     
     return StreamingResponse(
         process_csv_stream(db, csv_file=csv_file),
         media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no"
-        }
+        headers=SSE_HEADERS
     )
 
-@router.get("/api/movies")
-def get_movies(
-    skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=10000),
-    year_min: Optional[int] = Query(None),
-    year_max: Optional[int] = Query(None),
-    director: Optional[List[str]] = Query(None),
-    director_exclude: bool = Query(False),
-    country: Optional[List[str]] = Query(None),
-    country_exclude: bool = Query(False),
-    genre: Optional[List[str]] = Query(None),
-    genre_exclude: bool = Query(False),
-    runtime_min: Optional[int] = Query(None),
-    runtime_max: Optional[int] = Query(None),
-    original_language: Optional[List[str]] = Query(None),
-    original_language_exclude: bool = Query(False),
-    production_company: Optional[List[str]] = Query(None),
-    production_company_exclude: bool = Query(False),
-    spoken_language: Optional[str] = Query(None),
-    actor: Optional[List[str]] = Query(None),
-    actor_exclude: bool = Query(False),
-    writer: Optional[List[str]] = Query(None),
-    writer_exclude: bool = Query(False),
-    producer: Optional[List[str]] = Query(None),
-    producer_exclude: bool = Query(False),
-    collection: Optional[bool] = Query(None),
-    search: Optional[str] = Query(None),
-    date_added_min: Optional[str] = Query(None, description="Minimum date added (ISO format)"),
-    date_added_max: Optional[str] = Query(None, description="Maximum date added (ISO format)"),
-    sort_by: Optional[str] = Query(None, regex="^(title|year|runtime|date_added)$"),
-    sort_order: Optional[str] = Query(None, regex="^(asc|desc)$"),
-    sorts: Optional[str] = Query(None, description="JSON array of sort objects: [{\"field\": \"year\", \"order\": \"desc\"}]"),
-    favorites_only: Optional[bool] = Query(None),
-    seen_before: Optional[bool] = Query(None),
-    show_favorites_first: bool = Query(False),
-    favorited_directors_only: Optional[bool] = Query(None, description="Filter movies to only show those from favorited directors"),
-    exclude_seen_countries: Optional[bool] = Query(None, description="Filter movies to exclude those from countries in the seen list"),
-    list_filters: Optional[str] = Query(None, description="JSON object with list filters: {\"is_imdb_t250\": true, \"is_letterboxd_t250\": false}"),
-    streaming_service: Optional[List[int]] = Query(None, description="Filter by streaming service provider IDs (deprecated, use availability_type)"),
-    watch_region: Optional[str] = Query(None, description="ISO 3166-1 country code for streaming availability (e.g., US, GB)"),
-    streaming_provider_type: Optional[str] = Query(None, description="Filter by provider type: flatrate, rent, buy, free, ads"),
-    availability_type: Optional[List[str]] = Query(None, description="Filter by availability type(s): for_free, for_rent, to_buy, unavailable"),
-    availability_exclude: bool = Query(False, description="Exclude movies matching availability types instead of including them"),
-    preferred_services: Optional[List[int]] = Query(None, description="List of preferred streaming service provider IDs for availability filtering"),
-    count_only: Optional[bool] = Query(None, description="If true, return only total count (faster for random picker)"),
-    db: Session = Depends(get_db)
-):
-    """
-    Get movies with optional filtering and sorting.
-    """
-    query = db.query(Movie)
+def movie_list_item(movie: Movie, tmdb_data: Any, list_memberships: Dict[str, bool]) -> Dict[str, Any]:
+    """A movie as listed by GET /api/movies (and exported); tmdb_data may be just the LISTING_TMDB_FIELDS."""
+    poster_url, original_language, production_company, in_collection = listing_tmdb_summary(tmdb_data)
+    return {
+        "id": movie.id,
+        "title": movie.title,
+        "year": movie.year,
+        "letterboxd_uri": movie.letterboxd_uri,
+        "director": movie.director,
+        "country": movie.country,
+        "runtime": movie.runtime,
+        "genres": movie.genres or [],
+        "tmdb_id": movie.tmdb_id,
+        "poster_url": poster_url,
+        "original_language": original_language,
+        "is_favorite": bool(movie.is_favorite),
+        "seen_before": bool(movie.seen_before) if hasattr(movie, 'seen_before') else False,
+        "notes": movie.notes or "",
+        "production_company": production_company,
+        "in_collection": in_collection,
+        # Format created_at as ISO string for frontend
+        "date_added": format_date_added(movie.created_at),
+        **list_memberships
+    }
+
+def build_movies_query(
+    db: Session,
+    tracked_list_columns: List[str],
+    year_min: Optional[int] = None,
+    year_max: Optional[int] = None,
+    director: Optional[List[str]] = None,
+    director_exclude: bool = False,
+    country: Optional[List[str]] = None,
+    country_exclude: bool = False,
+    genre: Optional[List[str]] = None,
+    genre_exclude: bool = False,
+    runtime_min: Optional[int] = None,
+    runtime_max: Optional[int] = None,
+    original_language: Optional[List[str]] = None,
+    original_language_exclude: bool = False,
+    production_company: Optional[List[str]] = None,
+    production_company_exclude: bool = False,
+    spoken_language: Optional[str] = None,
+    actor: Optional[List[str]] = None,
+    actor_exclude: bool = False,
+    writer: Optional[List[str]] = None,
+    writer_exclude: bool = False,
+    producer: Optional[List[str]] = None,
+    producer_exclude: bool = False,
+    collection: Optional[bool] = None,
+    search: Optional[str] = None,
+    date_added_min: Optional[str] = None,
+    date_added_max: Optional[str] = None,
+    favorites_only: Optional[bool] = None,
+    seen_before: Optional[bool] = None,
+    favorited_directors_only: Optional[bool] = None,
+    exclude_seen_countries: Optional[bool] = None,
+    list_filters: Optional[str] = None,
+    streaming_service: Optional[List[int]] = None,
+    watch_region: Optional[str] = None,
+    streaming_provider_type: Optional[str] = None,
+    availability_type: Optional[List[str]] = None,
+    availability_exclude: bool = False,
+    preferred_services: Optional[List[int]] = None
+) -> Optional[Any]:
+    """
+    Build the filtered (unordered) movies query for GET /api/movies and the
+    export endpoint. Returns None when the filters can't match any movie, so
+    callers can skip the query.
+    """
+    # Filter conditions are collected here and applied in one filter() call below
+    conditions = []
     
     # Apply filters
     if year_min is not None:
-        query = query.filter(Movie.year >= year_min)
+        conditions.append(Movie.year >= year_min)
     if year_max is not None:
-        query = query.filter(Movie.year <= year_max)
+        conditions.append(Movie.year <= year_max)
     if director:
         # Handle array of directors (OR logic) - use the director column directly
         if isinstance(director, list) and len(director) > 0:
@@ -747,7 +1210,7 @@ def get_movies(
             if director_exclude:
                 # Exclude movies matching any of the directors
                 filter_condition = ~filter_condition
-            query = query.filter(filter_condition)
+            conditions.append(filter_condition)
         elif isinstance(director, str):
             # Backward compatibility: handle single string
             filter_condition = and_(
@@ -756,101 +1219,37 @@ def get_movies(
             )
             if director_exclude:
                 filter_condition = ~filter_condition
-            query = query.filter(filter_condition)
+            conditions.append(filter_condition)
     # Handle country filter and exclude_seen_countries together (OR logic when both present)
     country_filters_list = []
     
     if country:
-        # Handle array of countries (OR logic) - check both country column and production_countries in tmdb_data
-        if isinstance(country, list) and len(country) > 0:
-            country_filters = []
-            for c in country:
-                # Check both the country column (direct match) and tmdb_data.production_countries (JSON)
-                country_name = c.strip()
-                # Direct column match (case-insensitive)
-                column_filter = func.lower(Movie.country) == func.lower(country_name)
-                # JSON match in production_countries
-                escaped_name = country_name.lower().replace('"', '\\"')
-                json_filter = and_(
-                    func.lower(func.cast(Movie.tmdb_data, String)).like(f'%"production_countries"%'),
-                    func.lower(func.cast(Movie.tmdb_data, String)).like(f'%"name":"%{escaped_name}%"%')
-                )
-                # Match if either the column matches OR the JSON matches
-                country_filters.append(or_(column_filter, json_filter))
-            filter_condition = or_(*country_filters)
-            if country_exclude:
-                # Exclude movies matching any of the countries
-                filter_condition = ~filter_condition
-            country_filters_list.append(filter_condition)
-        elif isinstance(country, str):
-            # Backward compatibility: handle single string
-            country_name = country.strip()
-            # Check both the country column and JSON
-            column_filter = func.lower(Movie.country) == func.lower(country_name)
-            escaped_name = country_name.lower().replace('"', '\\"')
-            json_filter = and_(
-                func.lower(func.cast(Movie.tmdb_data, String)).like(f'%"production_countries"%'),
-                func.lower(func.cast(Movie.tmdb_data, String)).like(f'%"name":"%{escaped_name}%"%')
-            )
-            filter_condition = or_(column_filter, json_filter)
-            if country_exclude:
-                filter_condition = ~filter_condition
-            country_filters_list.append(filter_condition)
+        # Handle array of countries (OR logic); a single string is accepted for backward compatibility
+        country_names = country if isinstance(country, list) else [country]
+        filter_condition = movie_country_filter([c.strip() for c in country_names])
+        if country_exclude:
+            # Exclude movies matching any of the countries; movies with no
+            # known country are left out rather than treated as a non-match
+            filter_condition = and_(Movie.country.isnot(None), ~filter_condition)
+        country_filters_list.append(filter_condition)
     
     if exclude_seen_countries:
         # Filter movies to exclude those from countries in the seen list
-        seen_countries = db.query(SeenCountry).all()
-        if seen_countries:
-            seen_country_names = [sc.country_name for sc in seen_countries]
-            
-            # Country name aliases mapping (for matching different naming conventions)
-            country_aliases = {
-                'UK': ['United Kingdom', 'UK'],
-                'United Kingdom': ['United Kingdom', 'UK'],
-                'USA': ['United States of America', 'USA', 'United States'],
-                'United States of America': ['United States of America', 'USA', 'United States'],
-                'United States': ['United States of America', 'USA', 'United States'],
-            }
-            
-            # Build filters to exclude movies from seen countries
-            # Check both the country column and tmdb_data.production_countries
-            exclusion_filters = []
-            for country_name in seen_country_names:
-                # Get all aliases for this country (including the original name)
-                aliases = country_aliases.get(country_name, [country_name])
-                
-                # Create filters for each alias
-                alias_filters = []
-                for alias in aliases:
-                    # Direct column match (case-insensitive)
-                    column_filter = func.lower(Movie.country) == func.lower(alias)
-                    # JSON match in production_countries
-                    escaped_name = alias.lower().replace('"', '\\"')
-                    json_filter = and_(
-                        func.lower(func.cast(Movie.tmdb_data, String)).like(f'%"production_countries"%'),
-                        func.lower(func.cast(Movie.tmdb_data, String)).like(f'%"name":"%{escaped_name}%"%')
-                    )
-                    # Movie matches if either column OR JSON matches
-                    alias_filters.append(or_(column_filter, json_filter))
-                
-                # Add OR condition for all aliases of this country
-                if alias_filters:
-                    exclusion_filters.append(or_(*alias_filters))
-            
-            # Exclude movies that match any of the seen countries (or their aliases)
+        seen_country_names = cached_name_list(db, SeenCountry.country_name)
+        if seen_country_names:
+            # Exclude movies from any seen country (or its aliases)
             # This means: NOT (in seen countries) = in unseen countries
-            if exclusion_filters:
-                filter_condition = or_(*exclusion_filters)
-                country_filters_list.append(~filter_condition)
+            seen_aliases = expand_country_aliases(seen_country_names)
+            country_filters_list.append(and_(Movie.country.isnot(None), ~movie_country_filter(seen_aliases)))
     
     # Apply country filters with OR logic (unseen countries OR specified countries)
     if country_filters_list:
         combined_filter = or_(*country_filters_list)
-        query = query.filter(combined_filter)
+        conditions.append(combined_filter)
     if runtime_min is not None:
-        query = query.filter(Movie.runtime >= runtime_min)
+        conditions.append(Movie.runtime >= runtime_min)
     if runtime_max is not None:
-        query = query.filter(Movie.runtime <= runtime_max)
+        conditions.append(Movie.runtime <= runtime_max)
     if search:
         # Search requires all words to be present in one of the fields
         # This ensures "12 years a slave" won't match "12 angry men"
@@ -866,6 +1265,14 @@ def get_movies(
                 # No valid words, skip filtering
                 pass
             else:
+                # Narrow candidates with the trigram full-text index first; the
+                # LIKE filters below still decide the exact matches
+                fts_query = search_fts_query(search_words)
+                if fts_query and search_index_available():
+                    conditions.append(Movie.id.in_(
+                        text("SELECT rowid FROM movies_fts WHERE movies_fts MATCH :fts_query").bindparams(fts_query=fts_query)
+                    ))
+                
                 # Escape special characters in each word
                 escaped_words = [word.replace('%', '\\%').replace('_', '\\_') for word in search_words]
                 
@@ -873,7 +1280,7 @@ def get_movies(
                 field_filters = []
                 
                 # Title field: all words must be present
-                title_conditions = [Movie.title.ilike(f"%{word}%") for word in escaped_words]
+                title_conditions = [Movie.title.ilike(f"%{word}%", escape='\\') for word in escaped_words]
                 if title_conditions:
                     field_filters.append(and_(*title_conditions))
                 
@@ -881,7 +1288,7 @@ def get_movies(
                 notes_conditions = [
                     and_(
                         Movie.notes.isnot(None),
-                        Movie.notes.ilike(f"%{word}%")
+                        Movie.notes.ilike(f"%{word}%", escape='\\')
                     ) for word in escaped_words
                 ]
                 if notes_conditions:
@@ -891,7 +1298,7 @@ def get_movies(
                 director_conditions = [
                     and_(
                         Movie.director.isnot(None),
-                        Movie.director.ilike(f"%{word}%")
+                        Movie.director.ilike(f"%{word}%", escape='\\')
                     ) for word in escaped_words
                 ]
                 if director_conditions:
@@ -903,214 +1310,107 @@ def get_movies(
                 
                 # Match if any field contains ALL the words (OR between fields, AND within each field)
                 if field_filters:
-                    query = query.filter(or_(*field_filters))
+                    conditions.append(or_(*field_filters))
     if genre:
-        # Handle array of genres (OR logic) - check if any genre in the filter matches any genre in the movie
+        # Handle array of genres (OR logic); a single string is accepted for backward compatibility
         # Genres are stored as JSON array like ["Action", "Drama"]
-        # Use SQLite json_each to properly check if genre exists in the array
-        if isinstance(genre, list) and len(genre) > 0:
-            genre_conditions = []
-            for idx, g in enumerate(genre):
-                # Use json_each with parameter substitution - escape single quotes in genre name
-                escaped_genre = g.replace("'", "''")
-                if genre_exclude:
-                    # Use NOT EXISTS to exclude movies with this genre
-                    genre_conditions.append(
-                        text(f"NOT EXISTS (SELECT 1 FROM json_each(movies.genres) WHERE json_each.value = '{escaped_genre}')")
-                    )
-                else:
-                    genre_conditions.append(
-                        text(f"EXISTS (SELECT 1 FROM json_each(movies.genres) WHERE json_each.value = '{escaped_genre}')")
-                    )
-            # When excluding, we want AND logic (movie must not have ANY of the excluded genres)
-            # When including, we want OR logic (movie must have at least one of the genres)
-            if genre_exclude:
-                filter_condition = and_(*genre_conditions)
-            else:
-                filter_condition = or_(*genre_conditions)
-            query = query.filter(filter_condition)
-        elif isinstance(genre, str):
-            # Backward compatibility: handle single string
-            escaped_genre = genre.replace("'", "''")
-            if genre_exclude:
-                filter_condition = text(f"NOT EXISTS (SELECT 1 FROM json_each(movies.genres) WHERE json_each.value = '{escaped_genre}')")
-            else:
-                filter_condition = text(f"EXISTS (SELECT 1 FROM json_each(movies.genres) WHERE json_each.value = '{escaped_genre}')")
-            query = query.filter(filter_condition)
+        genres = genre if isinstance(genre, list) else [genre]
+        filter_condition = json_array_filter(Movie.genres, genres)
+        if genre_exclude:
+            # Exclude movies having any of the genres
+            filter_condition = ~filter_condition
+        conditions.append(filter_condition)
     if original_language:
-        # Handle array of languages (OR logic)
-        if isinstance(original_language, list) and len(original_language) > 0:
-            language_filters = [
-                func.json_extract(Movie.tmdb_data, '$.original_language') == lang
-                for lang in original_language
-            ]
-            filter_condition = or_(*language_filters)
-            if original_language_exclude:
-                # Exclude movies matching any of the languages
-                filter_condition = ~filter_condition
-            query = query.filter(filter_condition)
-        elif isinstance(original_language, str):
-            # Backward compatibility: handle single string
-            filter_condition = func.json_extract(Movie.tmdb_data, '$.original_language') == original_language
-            if original_language_exclude:
-                filter_condition = ~filter_condition
-            query = query.filter(filter_condition)
+        # Handle array of languages (OR logic); a single string is accepted for backward compatibility
+        languages = original_language if isinstance(original_language, list) else [original_language]
+        # original_language is an indexed column generated from tmdb_data
+        filter_condition = Movie.original_language.in_(languages)
+        if original_language_exclude:
+            # Exclude movies matching any of the languages
+            filter_condition = ~filter_condition
+        conditions.append(filter_condition)
     if production_company:
-        # Handle array of production companies (OR logic) - check all production companies in tmdb_data
-        if isinstance(production_company, list) and len(production_company) > 0:
-            company_filters = []
-            for company in production_company:
-                # Use json_each to check if company name exists in production_companies array
-                escaped_name = company.replace("'", "''")
-                company_filters.append(
-                    text(f"EXISTS (SELECT 1 FROM json_each(json_extract(movies.tmdb_data, '$.production_companies')) WHERE json_extract(json_each.value, '$.name') = '{escaped_name}')")
-                )
-            filter_condition = or_(*company_filters)
-            if production_company_exclude:
-                # Exclude movies matching any of the production companies
-                filter_condition = ~filter_condition
-            query = query.filter(filter_condition)
-        elif isinstance(production_company, str):
-            # Backward compatibility: handle single string
-            escaped_name = production_company.replace("'", "''")
-            filter_condition = text(f"EXISTS (SELECT 1 FROM json_each(json_extract(movies.tmdb_data, '$.production_companies')) WHERE json_extract(json_each.value, '$.name') = '{escaped_name}')")
-            if production_company_exclude:
-                filter_condition = ~filter_condition
-            query = query.filter(filter_condition)
-    if actor:
-        # Handle array of actors (OR logic) - search in credits.cast
-        if isinstance(actor, list) and len(actor) > 0:
-            actor_filters = []
-            for a in actor:
-                # Use json_each to check if actor name exists in credits.cast array
-                escaped_name = a.replace("'", "''")
-                actor_filters.append(
-                    text(f"EXISTS (SELECT 1 FROM json_each(json_extract(movies.tmdb_data, '$.credits.cast')) WHERE json_extract(json_each.value, '$.name') = '{escaped_name}')")
-                )
-            filter_condition = or_(*actor_filters)
-            if actor_exclude:
-                # Exclude movies matching any of the actors
-                filter_condition = ~filter_condition
-            query = query.filter(filter_condition)
-        elif isinstance(actor, str):
-            escaped_name = actor.replace("'", "''")
-            filter_condition = text(f"EXISTS (SELECT 1 FROM json_each(json_extract(movies.tmdb_data, '$.credits.cast')) WHERE json_extract(json_each.value, '$.name') = '{escaped_name}')")
-            if actor_exclude:
-                filter_condition = ~filter_condition
-            query = query.filter(filter_condition)
-    if writer:
-        # Handle array of writers (OR logic) - search in credits.crew where job is Writer or Screenplay
-        if isinstance(writer, list) and len(writer) > 0:
-            all_writer_filters = []
-            for w in writer:
-                # Use json_each to check if writer name exists in credits.crew with job Writer or Screenplay
-                escaped_name = w.replace("'", "''")
-                all_writer_filters.append(
-                    text(f"EXISTS (SELECT 1 FROM json_each(json_extract(movies.tmdb_data, '$.credits.crew')) WHERE json_extract(json_each.value, '$.name') = '{escaped_name}' AND (json_extract(json_each.value, '$.job') = 'Writer' OR json_extract(json_each.value, '$.job') = 'Screenplay'))")
-                )
-            filter_condition = or_(*all_writer_filters)
-            if writer_exclude:
-                # Exclude movies matching any of the writers
-                filter_condition = ~filter_condition
-            query = query.filter(filter_condition)
-        elif isinstance(writer, str):
-            escaped_name = writer.replace("'", "''")
-            filter_condition = text(f"EXISTS (SELECT 1 FROM json_each(json_extract(movies.tmdb_data, '$.credits.crew')) WHERE json_extract(json_each.value, '$.name') = '{escaped_name}' AND (json_extract(json_each.value, '$.job') = 'Writer' OR json_extract(json_each.value, '$.job') = 'Screenplay'))")
-            if writer_exclude:
-                filter_condition = ~filter_condition
-            query = query.filter(filter_condition)
-    if producer:
-        # Handle array of producers (OR logic) - search in credits.crew where job is Producer or Executive Producer
-        if isinstance(producer, list) and len(producer) > 0:
-            all_producer_filters = []
-            for p in producer:
-                # Use json_each to check if producer name exists in credits.crew with job Producer or Executive Producer
-                escaped_name = p.replace("'", "''")
-                all_producer_filters.append(
-                    text(f"EXISTS (SELECT 1 FROM json_each(json_extract(movies.tmdb_data, '$.credits.crew')) WHERE json_extract(json_each.value, '$.name') = '{escaped_name}' AND (json_extract(json_each.value, '$.job') = 'Producer' OR json_extract(json_each.value, '$.job') = 'Executive Producer'))")
-                )
-            filter_condition = or_(*all_producer_filters)
-            if producer_exclude:
-                # Exclude movies matching any of the producers
-                filter_condition = ~filter_condition
-            query = query.filter(filter_condition)
-        elif isinstance(producer, str):
-            escaped_name = producer.replace("'", "''")
-            filter_condition = text(f"EXISTS (SELECT 1 FROM json_each(json_extract(movies.tmdb_data, '$.credits.crew')) WHERE json_extract(json_each.value, '$.name') = '{escaped_name}' AND (json_extract(json_each.value, '$.job') = 'Producer' OR json_extract(json_each.value, '$.job') = 'Executive Producer'))")
-            if producer_exclude:
+        # Handle array of production companies (OR logic); a single string is accepted for backward compatibility
+        companies = production_company if isinstance(production_company, list) else [production_company]
+        # Matched against movie_facets, the same values /api/movies/production-companies lists
+        filter_condition = Movie.id.in_(
+            select(MovieFacet.movie_id).where(MovieFacet.kind == 'production_company', MovieFacet.value.in_(companies))
+        )
+        if production_company_exclude:
+            # Exclude movies matching any of the production companies
+            filter_condition = ~filter_condition
+        conditions.append(filter_condition)
+    # Cast and crew filters (OR logic within each); a single string is accepted for backward compatibility
+    for role, names, exclude in (
+        ('actor', actor, actor_exclude),
+        ('writer', writer, writer_exclude),
+        ('producer', producer, producer_exclude),
+    ):
+        if names:
+            filter_condition = movie_person_filter(role, names if isinstance(names, list) else [names])
+            if exclude:
+                # Exclude movies matching any of the names
                 filter_condition = ~filter_condition
-            query = query.filter(filter_condition)
+            conditions.append(filter_condition)
     if spoken_language:
         # Filter by spoken language ISO code in tmdb_data.spoken_languages
-        # Check if any spoken language ISO code matches (searching for the ISO code in the JSON)
-        query = query.filter(
-            func.cast(Movie.tmdb_data, String).like(f'%"iso_639_1":"{spoken_language}"%')
-        )
+        # (normalized into movie_spoken_languages by triggers)
+        conditions.append(Movie.id.in_(
+            select(MovieSpokenLanguage.movie_id).where(MovieSpokenLanguage.iso_639_1 == spoken_language)
+        ))
     if collection is not None:
         # Filter by whether movie belongs to a collection (boolean)
         # collection=True means only show movies in a collection
         # collection=False means only show movies NOT in a collection
-        if collection:
-            # Movie has a collection if belongs_to_collection exists and is not null
-            # Check if the JSON path exists and is not null
-            query = query.filter(
-                func.json_extract(Movie.tmdb_data, '$.belongs_to_collection').isnot(None)
-            )
-        else:
-            # Movie does not have a collection if belongs_to_collection is null or doesn't exist
-            # json_extract returns NULL if the path doesn't exist or is null
-            query = query.filter(
-                func.json_extract(Movie.tmdb_data, '$.belongs_to_collection').is_(None)
-            )
+        # in_collection is an indexed column generated from tmdb_data.belongs_to_collection
+        # (1 when it exists and is not null)
+        conditions.append(Movie.in_collection == (1 if collection else 0))
     if favorites_only is not None:
         # Filter by favorites (boolean)
         # favorites_only=True means only show favorite movies
         # favorites_only=False means only show non-favorite movies
         if favorites_only:
-            query = query.filter(Movie.is_favorite.is_(True))
+            conditions.append(Movie.is_favorite.is_(True))
         else:
-            query = query.filter(Movie.is_favorite.is_(False))
+            conditions.append(Movie.is_favorite.is_(False))
     
     if seen_before is not None:
         # Filter by seen_before (boolean)
         # seen_before=True means only show movies that have been seen
         # seen_before=False means only show movies that haven't been seen
         if seen_before:
-            query = query.filter(Movie.seen_before.is_(True))
+            conditions.append(Movie.seen_before.is_(True))
         else:
-            query = query.filter(Movie.seen_before.is_(False))
+            conditions.append(Movie.seen_before.is_(False))
     
     if favorited_directors_only:
         # Filter movies to only show those from favorited directors
-        favorite_directors = db.query(FavoriteDirector).all()
-        if favorite_directors:
-            favorite_director_names = [fd.director_name for fd in favorite_directors]
-            query = query.filter(Movie.director.in_(favorite_director_names))
+        favorite_director_names = cached_name_list(db, FavoriteDirector.director_name)
+        if favorite_director_names:
+            conditions.append(Movie.director.in_(favorite_director_names))
         else:
-            # If no favorite directors, return empty result
-            query = query.filter(Movie.id == -1)  # Impossible condition
+            # No favorite directors means nothing can match
+            return None
     
     # Filter by date_added (created_at)
     if date_added_min is not None and isinstance(date_added_min, str):
         try:
             min_date = datetime.fromisoformat(date_added_min.replace('Z', '+00:00'))
-            query = query.filter(Movie.created_at >= min_date)
+            conditions.append(Movie.created_at >= min_date)
         except (ValueError, AttributeError) as e:
             logger.warning(f"Invalid date_added_min format: {date_added_min}, error: {e}")
     if date_added_max is not None and isinstance(date_added_max, str):
         try:
             max_date = datetime.fromisoformat(date_added_max.replace('Z', '+00:00'))
-            query = query.filter(Movie.created_at <= max_date)
+            conditions.append(Movie.created_at <= max_date)
         except (ValueError, AttributeError) as e:
             logger.warning(f"Invalid date_added_max format: {date_added_max}, error: {e}")
     
     # Apply list filters (tracked lists)
     if list_filters:
         try:
-            filters_dict = json.loads(list_filters)
+            filters_dict = orjson.loads(list_filters)
             if isinstance(filters_dict, dict):
-                tracked_list_columns = get_tracked_list_names()
-                
                 # Handle OR groups
                 or_groups = filters_dict.get('or_groups', [])
                 and_filters = filters_dict.get('and_filters', {})
@@ -1127,9 +1427,9 @@ def get_movies(
                         # filter_value=False means only show movies NOT in this list
                         # Use raw SQL since these columns are dynamically added
                         if filter_value:
-                            query = query.filter(text(f"movies.{column_name} = 1"))
+                            conditions.append(tracked_list_column(column_name) == 1)
                         else:
-                            query = query.filter(text(f"movies.{column_name} = 0"))
+                            conditions.append(tracked_list_column(column_name) == 0)
                 
                 # Apply OR groups
                 if or_groups and isinstance(or_groups, list):
@@ -1140,7 +1440,7 @@ def get_movies(
                             group_conditions = []
                             for column_name in group:
                                 if column_name in tracked_list_columns:
-                                    group_conditions.append(text(f"movies.{column_name} = 1"))
+                                    group_conditions.append(tracked_list_column(column_name) == 1)
                             if group_conditions:
                                 or_conditions.append(or_(*group_conditions))
                         elif isinstance(group, dict) and 'filters' in group:
@@ -1151,153 +1451,117 @@ def get_movies(
                                     for column_name, filter_value in filter_obj.items():
                                         if column_name in tracked_list_columns and filter_value is not None:
                                             if filter_value:
-                                                group_conditions.append(text(f"movies.{column_name} = 1"))
+                                                group_conditions.append(tracked_list_column(column_name) == 1)
                                             else:
-                                                group_conditions.append(text(f"movies.{column_name} = 0"))
+                                                group_conditions.append(tracked_list_column(column_name) == 0)
                             if group_conditions:
                                 or_conditions.append(or_(*group_conditions))
                     
                     # Apply all OR groups (each group is OR'd internally, groups are AND'd together)
                     if or_conditions:
-                        query = query.filter(and_(*or_conditions))
+                        conditions.append(and_(*or_conditions))
                         
-        except (json.JSONDecodeError, TypeError) as e:
+        except (orjson.JSONDecodeError, TypeError) as e:
             logger.warning(f"Failed to parse list_filters parameter: {e}")
     
     # Filter by streaming service availability
     if streaming_service and watch_region and isinstance(watch_region, str):
-        # Normalize country code to uppercase
-        watch_region_upper = watch_region.upper()
-        provider_type = streaming_provider_type or 'flatrate'  # Default to flatrate if not specified
-        
-        if isinstance(streaming_service, list) and len(streaming_service) > 0:
-            streaming_conditions = []
-            for provider_id in streaming_service:
-                # Check if provider exists in watch/providers.results[watch_region][provider_type]
-                # Use JSON path: $.watch.providers.results.WATCH_REGION.PROVIDER_TYPE[*].provider_id
-                # Or try alternative path: $.watch/providers.results.WATCH_REGION.PROVIDER_TYPE[*].provider_id
-                escaped_region = watch_region_upper.replace("'", "''")
-                
-                # Try both possible JSON paths for watch/providers
-                # Path 1: $.watch.providers.results.US.flatrate[*].provider_id
-                path1 = f"$.watch.providers.results.{escaped_region}.{provider_type}"
-                # Path 2: $.'watch/providers'.results.US.flatrate[*].provider_id
-                path2 = f"$.'watch/providers'.results.{escaped_region}.{provider_type}"
-                
-                # Use json_each to check if provider_id exists in the array
-                # We need to check all provider types if streaming_provider_type is not specified
-                if streaming_provider_type:
-                    # Check specific provider type
-                    condition1 = text(
-                        f"EXISTS (SELECT 1 FROM json_each(json_extract(movies.tmdb_data, '{path1}')) "
-                        f"WHERE json_extract(json_each.value, '$.provider_id') = {provider_id})"
-                    )
-                    condition2 = text(
-                        f"EXISTS (SELECT 1 FROM json_each(json_extract(movies.tmdb_data, '{path2}')) "
-                        f"WHERE json_extract(json_each.value, '$.provider_id') = {provider_id})"
-                    )
-                    streaming_conditions.append(or_(condition1, condition2))
-                else:
-                    # Check all provider types (flatrate, rent, buy, free, ads)
-                    all_types = ['flatrate', 'rent', 'buy', 'free', 'ads']
-                    type_conditions = []
-                    for pt in all_types:
-                        path1 = f"$.watch.providers.results.{escaped_region}.{pt}"
-                        path2 = f"$.'watch/providers'.results.{escaped_region}.{pt}"
-                        condition1 = text(
-                            f"EXISTS (SELECT 1 FROM json_each(json_extract(movies.tmdb_data, '{path1}')) "
-                            f"WHERE json_extract(json_each.value, '$.provider_id') = {provider_id})"
-                        )
-                        condition2 = text(
-                            f"EXISTS (SELECT 1 FROM json_each(json_extract(movies.tmdb_data, '{path2}')) "
-                            f"WHERE json_extract(json_each.value, '$.provider_id') = {provider_id})"
-                        )
-                        type_conditions.append(or_(condition1, condition2))
-                    streaming_conditions.append(or_(*type_conditions))
-            
-            if streaming_conditions:
-                # Movies matching ANY of the specified providers (OR logic)
-                query = query.filter(or_(*streaming_conditions))
-        elif isinstance(streaming_service, int):
-            # Backward compatibility: handle single provider ID
-            escaped_region = watch_region_upper.replace("'", "''")
-            provider_type = streaming_provider_type or 'flatrate'
-            
-            if streaming_provider_type:
-                path1 = f"$.watch.providers.results.{escaped_region}.{provider_type}"
-                path2 = f"$.'watch/providers'.results.{escaped_region}.{provider_type}"
-                condition1 = text(
-                    f"EXISTS (SELECT 1 FROM json_each(json_extract(movies.tmdb_data, '{path1}')) "
-                    f"WHERE json_extract(json_each.value, '$.provider_id') = {streaming_service})"
-                )
-                condition2 = text(
-                    f"EXISTS (SELECT 1 FROM json_each(json_extract(movies.tmdb_data, '{path2}')) "
-                    f"WHERE json_extract(json_each.value, '$.provider_id') = {streaming_service})"
-                )
-                query = query.filter(or_(condition1, condition2))
-            else:
-                # Check all provider types
-                all_types = ['flatrate', 'rent', 'buy', 'free', 'ads']
-                type_conditions = []
-                for pt in all_types:
-                    path1 = f"$.watch.providers.results.{escaped_region}.{pt}"
-                    path2 = f"$.'watch/providers'.results.{escaped_region}.{pt}"
-                    condition1 = text(
-                        f"EXISTS (SELECT 1 FROM json_each(json_extract(movies.tmdb_data, '{path1}')) "
-                        f"WHERE json_extract(json_each.value, '$.provider_id') = {streaming_service})"
-                    )
-                    condition2 = text(
-                        f"EXISTS (SELECT 1 FROM json_each(json_extract(movies.tmdb_data, '{path2}')) "
-                        f"WHERE json_extract(json_each.value, '$.provider_id') = {streaming_service})"
-                    )
-                    type_conditions.append(or_(condition1, condition2))
-                query = query.filter(or_(*type_conditions))
-    
-    # Availability filtering is now done in Python after fetching movies
-    # (see Python-based filtering section below)
-    
-    # Helper function to get sort expression for a field
-    def get_sort_expression(field: str):
-        """Returns SQLAlchemy sort expression for a given field."""
-        if field == "title":
-            return Movie.title
-        elif field == "year":
-            # Sort by release_date from tmdb_data (more precise than year), fallback to year if release_date is missing
-            release_date_expr = func.json_extract(Movie.tmdb_data, '$.release_date')
-            year_fallback = text("CAST(movies.year AS TEXT) || '-01-01'")
-            return func.coalesce(release_date_expr, year_fallback)
-        elif field == "runtime":
-            return Movie.runtime
-        elif field == "director":
-            return Movie.director
-        elif field == "country":
-            return Movie.country
-        elif field == "original_language":
-            return Movie.original_language
-        elif field == "production_company":
-            first_company = func.json_extract(Movie.tmdb_data, '$.production_companies[0].name')
-            return func.coalesce(first_company, '')
-        elif field == "genres":
-            first_genre = func.json_extract(Movie.genres, '$[0]')
-            return func.coalesce(first_genre, '')
-        elif field == "in_collection":
-            collection_expr = func.json_extract(Movie.tmdb_data, '$.belongs_to_collection')
-            return case(
-                (collection_expr.isnot(None), 1),
-                else_=0
-            )
-        elif field == "is_favorite":
-            return Movie.is_favorite
-        elif field == "date_added":
-            return Movie.created_at
-        elif field.startswith("is_"):
-            # Handle tracked list columns (dynamically added, stored as INTEGER)
-            return text(f"movies.{field}")
-        else:
-            # Default: sort by release_date (fallback to year)
-            release_date_expr = func.json_extract(Movie.tmdb_data, '$.release_date')
-            year_fallback = text("CAST(movies.year AS TEXT) || '-01-01'")
-            return func.coalesce(release_date_expr, year_fallback)
+        # Handle array of provider IDs (OR logic); a single ID is accepted for backward compatibility
+        provider_ids = streaming_service if isinstance(streaming_service, list) else [streaming_service]
+        # Check the given provider type, or all of them if not specified
+        provider_types = [streaming_provider_type] if streaming_provider_type else ['flatrate', 'rent', 'buy', 'free', 'ads']
+        conditions.append(movie_provider_filter(watch_region.upper(), provider_types, provider_ids))
+    
+    # Filter by availability for the preferred services (movie_providers lookups)
+    if availability_type and isinstance(availability_type, list) and watch_region and preferred_services:
+        matches_availability = availability_filter_clause(watch_region, preferred_services, availability_type)
+        conditions.append(not_(matches_availability) if availability_exclude else matches_availability)
+    
+    query = db.query(Movie)
+    if conditions:
+        query = query.filter(and_(*conditions))
+    return query
+
+@router.get("/api/movies")
+def get_movies(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=10000),
+    year_min: Optional[int] = Query(None),
+    year_max: Optional[int] = Query(None),
+    director: Optional[List[str]] = Query(None),
+    director_exclude: bool = Query(False),
+    country: Optional[List[str]] = Query(None),
+    country_exclude: bool = Query(False),
+    genre: Optional[List[str]] = Query(None),
+    genre_exclude: bool = Query(False),
+    runtime_min: Optional[int] = Query(None),
+    runtime_max: Optional[int] = Query(None),
+    original_language: Optional[List[str]] = Query(None),
+    original_language_exclude: bool = Query(False),
+    production_company: Optional[List[str]] = Query(None),
+    production_company_exclude: bool = Query(False),
+    spoken_language: Optional[str] = Query(None),
+    actor: Optional[List[str]] = Query(None),
+    actor_exclude: bool = Query(False),
+    writer: Optional[List[str]] = Query(None),
+    writer_exclude: bool = Query(False),
+    producer: Optional[List[str]] = Query(None),
+    producer_exclude: bool = Query(False),
+    collection: Optional[bool] = Query(None),
+    search: Optional[str] = Query(None),
+    date_added_min: Optional[str] = Query(None, description="Minimum date added (ISO format)"),
+    date_added_max: Optional[str] = Query(None, description="Maximum date added (ISO format)"),
+    sort_by: Optional[str] = Query(None, regex="^(title|year|runtime|date_added)$"),
+    sort_order: Optional[str] = Query(None, regex="^(asc|desc)$"),
+    sorts: Optional[str] = Query(None, description="JSON array of sort objects: [{\"field\": \"year\", \"order\": \"desc\"}]"),
+    favorites_only: Optional[bool] = Query(None),
+    seen_before: Optional[bool] = Query(None),
+    show_favorites_first: bool = Query(False),
+    favorited_directors_only: Optional[bool] = Query(None, description="Filter movies to only show those from favorited directors"),
+    exclude_seen_countries: Optional[bool] = Query(None, description="Filter movies to exclude those from countries in the seen list"),
+    list_filters: Optional[str] = Query(None, description="JSON object with list filters: {\"is_imdb_t250\": true, \"is_letterboxd_t250\": false}"),
+    streaming_service: Optional[List[int]] = Query(None, description="Filter by streaming service provider IDs (deprecated, use availability_type)"),
+    watch_region: Optional[str] = Query(None, description="ISO 3166-1 country code for streaming availability (e.g., US, GB)"),
+    streaming_provider_type: Optional[str] = Query(None, description="Filter by provider type: flatrate, rent, buy, free, ads"),
+    availability_type: Optional[List[str]] = Query(None, description="Filter by availability type(s): for_free, for_rent, to_buy, unavailable"),
+    availability_exclude: bool = Query(False, description="Exclude movies matching availability types instead of including them"),
+    preferred_services: Optional[List[int]] = Query(None, description="List of preferred streaming service provider IDs for availability filtering"),
+    count_only: Optional[bool] = Query(None, description="If true, return only total count (faster for random picker)"),
+    db: Session = Depends(get_db)
+):
+    """
+    Get movies with optional filtering and sorting.
+    """
+    # Tracked list columns, read once for the list filters and membership prefetch
+    tracked_list_columns = get_tracked_list_names()
+    
+    query = build_movies_query(
+        db, tracked_list_columns,
+        year_min=year_min, year_max=year_max,
+        director=director, director_exclude=director_exclude,
+        country=country, country_exclude=country_exclude,
+        genre=genre, genre_exclude=genre_exclude,
+        runtime_min=runtime_min, runtime_max=runtime_max,
+        original_language=original_language, original_language_exclude=original_language_exclude,
+        production_company=production_company, production_company_exclude=production_company_exclude,
+        spoken_language=spoken_language,
+        actor=actor, actor_exclude=actor_exclude,
+        writer=writer, writer_exclude=writer_exclude,
+        producer=producer, producer_exclude=producer_exclude,
+        collection=collection, search=search,
+        date_added_min=date_added_min, date_added_max=date_added_max,
+        favorites_only=favorites_only, seen_before=seen_before,
+        favorited_directors_only=favorited_directors_only, exclude_seen_countries=exclude_seen_countries,
+        list_filters=list_filters,
+        streaming_service=streaming_service, watch_region=watch_region, streaming_provider_type=streaming_provider_type,
+        availability_type=availability_type, availability_exclude=availability_exclude,
+        preferred_services=preferred_services
+    )
+    if query is None:
+        # Nothing can match; skip the query entirely
+        if count_only:
+            return {"movies": [], "total": 0, "skip": 0, "limit": 0}
+        return {"movies": [], "total": 0, "skip": skip, "limit": limit}
     
     # Parse sorts to determine if we need expansion (genres or production_company)
     first_sort_needs_expansion = False
@@ -1305,14 +1569,14 @@ def get_movies(
     sorts_list = []
     if sorts:
         try:
-            sorts_list = json.loads(sorts)
+            sorts_list = orjson.loads(sorts)
             if isinstance(sorts_list, list) and len(sorts_list) > 0:
                 first_sort = sorts_list[0]
                 if isinstance(first_sort, dict):
                     first_sort_field = first_sort.get('field')
                     if first_sort_field in ['genres', 'production_company']:
                         first_sort_needs_expansion = True
-        except (json.JSONDecodeError, TypeError) as e:
+        except (orjson.JSONDecodeError, TypeError) as e:
             logger.warning(f"Failed to parse sorts parameter: {e}")
     
     # Build order_by list
@@ -1329,22 +1593,22 @@ def get_movies(
                 for sort_obj in sorts_list:
                     if isinstance(sort_obj, dict) and 'field' in sort_obj and 'order' in sort_obj:
                         field = sort_obj['field']
-                        # Skip genres and production_company from SQL order_by if they're the first sort (we'll handle it in Python)
+                        # Skip genres and production_company from order_by if they're the first sort (the expansion below orders by them)
                         if field in ['genres', 'production_company'] and first_sort_needs_expansion and field == first_sort_field:
                             continue
                         order = sort_obj['order']
-                        expr = get_sort_expression(field)
+                        expr = sort_expression(field)
                         if order == "asc":
                             order_by_list.append(expr.asc().nullslast())
                         else:
                             order_by_list.append(expr.desc().nullslast())
-        except (json.JSONDecodeError, TypeError) as e:
-            logger.warning(f"Failed to parse sorts parameter: {e}")
-            # Fall back to default sorting
+        except TypeError as e:
+            # e.g. an unhashable (list or object) sort field
+            logger.warning(f"Invalid sorts parameter: {e}")
     
     # Backward compatibility: use sort_by/sort_order if sorts not provided
     if not sorts and sort_by:
-        expr = get_sort_expression(sort_by)
+        expr = sort_expression(sort_by)
         sort_order_val = sort_order if sort_order else "desc"
         if sort_order_val == "asc":
             order_by_list.append(expr.asc().nullslast())
@@ -1353,333 +1617,73 @@ def get_movies(
         # Add secondary sort by title for backward compatibility
         order_by_list.append(Movie.title.asc().nullslast())
     elif not sorts and not sort_by:
-        # Default: sort by release_date (fallback to year)
-        expr = get_sort_expression("year")
-        order_by_list.append(expr.desc().nullslast())
-        order_by_list.append(Movie.title.asc().nullslast())
+        order_by_list.extend(DEFAULT_LISTING_ORDER)
     
     # Apply all sorts (excluding genres/production_company if they're the first sort)
     if order_by_list:
         query = query.order_by(*order_by_list)
 
-    # Fast path: when no Python-side availability filter and no genre/production_company expansion,
+    # Fast path: when no genre/production_company expansion,
     # use DB count + offset/limit instead of loading all rows (much faster for large lists and random picker).
-    has_availability_filter = (
-        availability_type is not None
-        and isinstance(availability_type, list)
-        and len(availability_type) > 0
-        and watch_region
-        and preferred_services is not None
-        and len(preferred_services) > 0
-    )
-    use_fast_path = not has_availability_filter and not first_sort_needs_expansion
-
-    if count_only and use_fast_path:
-        total = query.count()
-        return {"movies": [], "total": total, "skip": 0, "limit": 0}
-
-    if use_fast_path and not count_only:
-        total = query.count()
-        movies = query.offset(skip).limit(limit).all()
-    else:
-        # Fetch all movies after SQL filters (before Python-based availability filtering and expansion)
-        all_movies = query.all()
-
-        # Apply Python-based availability filtering if needed
-        if (availability_type is not None and
-            isinstance(availability_type, list) and len(availability_type) > 0 and
-            watch_region and
-            preferred_services is not None and
-            len(preferred_services) > 0):
-
-            filtered_movies = []
-            for movie in all_movies:
-                matches_availability = check_movie_availability(
-                    movie.tmdb_data,
-                    watch_region,
-                    preferred_services,
-                    availability_type
-                )
-                # If availability_exclude is True, include movies that DON'T match
-                # If availability_exclude is False, include movies that DO match
-                if availability_exclude:
-                    if not matches_availability:
-                        filtered_movies.append(movie)
-                else:
-                    if matches_availability:
-                        filtered_movies.append(movie)
-            all_movies = filtered_movies
-
-        # Handle expansion: if sorting by genres or production_company first, expand movies
-        if first_sort_needs_expansion and first_sort_field:
-            # Use the already-fetched (and possibly filtered) movies
-
-            # Expand movies by genres or production_company
-            expanded_movies = []
-            for movie in all_movies:
-                if first_sort_field == 'genres':
-                    movie_genres = movie.genres or []
-                    if not movie_genres or len(movie_genres) == 0:
-                        # Movies with no genres appear once with empty genre
-                        expanded_movies.append((movie, None))
-                    else:
-                        # Create one entry per genre
-                        for genre in sorted(movie_genres):  # Sort genres alphabetically for consistent ordering
-                            expanded_movies.append((movie, genre))
-                elif first_sort_field == 'production_company':
-                    # Extract production companies from tmdb_data
-                    production_companies = []
-                    if movie.tmdb_data:
-                        tmdb_data = movie.tmdb_data
-                        if isinstance(tmdb_data, str):
-                            try:
-                                tmdb_data = json.loads(tmdb_data)
-                            except Exception as e:
-                                logger.warning(f"Failed to parse tmdb_data for movie {movie.id}: {e}")
-                                tmdb_data = {}
-                        if isinstance(tmdb_data, dict):
-                            prod_companies = tmdb_data.get('production_companies', [])
-                            if prod_companies and isinstance(prod_companies, list):
-                                company_names = [company.get('name') for company in prod_companies if isinstance(company, dict) and company.get('name')]
-                                production_companies = sorted(company_names)  # Sort alphabetically
-
-                    if not production_companies or len(production_companies) == 0:
-                        # Movies with no production companies appear once with empty company
-                        expanded_movies.append((movie, None))
-                    else:
-                        # Create one entry per production company
-                        for company in production_companies:
-                            expanded_movies.append((movie, company))
-                else:
-                    # Fallback: should not happen, but if it does, add movie without expansion
-                    logger.warning(f"Unexpected first_sort_field: {first_sort_field}, adding movie without expansion")
-                    expanded_movies.append((movie, None))
-
-            # Sort expanded movies by first sort field, then by other sorts
-            first_sort_order = sorts_list[0].get('order', 'asc') if sorts_list else 'asc'
-            other_sorts = sorts_list[1:] if len(sorts_list) > 1 else []
-
-            def get_sort_key(item):
-                movie, first_sort_value = item
-                key = []
-
-                # First sort by the expansion field (genre or production_company)
-                # Use sentinel value for nulls to ensure they sort last
-                if first_sort_value:
-                    sort_value = first_sort_value
-                else:
-                    # Use a large Unicode string that sorts after everything
-                    sort_value = '\uffff' * 100
-                key.append((sort_value, first_sort_order == 'desc'))
-
-                # Then by other sorts
-                for sort_obj in other_sorts:
-                    if not isinstance(sort_obj, dict) or 'field' not in sort_obj:
-                        continue
-                    field = sort_obj['field']
-                    order = sort_obj.get('order', 'asc')
-                    is_desc = order == 'desc'
-
-                    if field == 'title':
-                        if movie.title:
-                            value = movie.title
-                        else:
-                            # Nulls sort last: use large string
-                            value = '\uffff' * 100
-                        key.append((value, is_desc))
-                    elif field == 'year':
-                        if movie.year is not None:
-                            value = movie.year
-                        else:
-                            # Nulls sort last: use inf for asc, -inf for desc
-                            value = float('inf') if not is_desc else float('-inf')
-                        key.append((value, is_desc))
-                    elif field == 'runtime':
-                        if movie.runtime is not None:
-                            value = movie.runtime
-                        else:
-                            # Nulls sort last: use inf for asc, -inf for desc
-                            value = float('inf') if not is_desc else float('-inf')
-                        key.append((value, is_desc))
-                    elif field == 'director':
-                        if movie.director:
-                            value = movie.director
-                        else:
-                            # Nulls sort last: use large string
-                            value = '\uffff' * 100
-                        key.append((value, is_desc))
-                    elif field == 'country':
-                        if movie.country:
-                            value = movie.country
-                        else:
-                            # Nulls sort last: use large string
-                            value = '\uffff' * 100
-                        key.append((value, is_desc))
-                    elif field == 'original_language':
-                        value = ''
-                        if movie.tmdb_data:
-                            tmdb_data = movie.tmdb_data
-                            if isinstance(tmdb_data, str):
-                                try:
-                                    tmdb_data = json.loads(tmdb_data)
-                                except:
-                                    tmdb_data = {}
-                            if isinstance(tmdb_data, dict):
-                                value = tmdb_data.get('original_language', '') or ''
-                        if not value:
-                            # Nulls sort last: use large string
-                            value = '\uffff' * 100
-                        key.append((value, is_desc))
-                    elif field == 'production_company':
-                        # For production_company in secondary sorts, use first company from tmdb_data
-                        value = ''
-                        if movie.tmdb_data:
-                            tmdb_data = movie.tmdb_data
-                            if isinstance(tmdb_data, str):
-                                try:
-                                    tmdb_data = json.loads(tmdb_data)
-                                except:
-                                    tmdb_data = {}
-                            if isinstance(tmdb_data, dict):
-                                prod_companies = tmdb_data.get('production_companies', [])
-                                if prod_companies and isinstance(prod_companies, list) and len(prod_companies) > 0:
-                                    first_company = prod_companies[0].get('name') if isinstance(prod_companies[0], dict) else ''
-                                    value = first_company or ''
-                        if not value:
-                            # Nulls sort last: use large string
-                            value = '\uffff' * 100
-                        key.append((value, is_desc))
-                    elif field == 'date_added':
-                        if movie.created_at:
-                            value = movie.created_at
-                        else:
-                            # Nulls sort last: use future date for asc, past date for desc
-                            value = datetime.max if not is_desc else datetime.min
-                        key.append((value, is_desc))
-                    elif field == 'is_favorite':
-                        value = bool(movie.is_favorite)
-                        key.append((value, order == 'desc'))
-                    elif field == 'in_collection':
-                        if movie.tmdb_data:
-                            tmdb_data = movie.tmdb_data
-                            if isinstance(tmdb_data, str):
-                                try:
-                                    tmdb_data = json.loads(tmdb_data)
-                                except:
-                                    tmdb_data = {}
-                            if isinstance(tmdb_data, dict):
-                                belongs_to_collection = tmdb_data.get('belongs_to_collection')
-                                value = belongs_to_collection is not None and belongs_to_collection != ''
-                            else:
-                                value = False
-                        else:
-                            value = False
-                        key.append((value, order == 'desc'))
-                    # Add is_favorite handling for favorites first
-                    if show_favorites_first:
-                        # Already handled in initial query sorting, but need to maintain order
-                        pass
-
-                return key
-
-            # Sort expanded movies
-            expanded_movies.sort(key=lambda x: get_sort_key(x))
-
-            # Get total count from expanded list
-            total = len(expanded_movies)
-
-            # Apply pagination to expanded list
-            paginated_expanded = expanded_movies[skip:skip + limit]
-
-            # Extract just the movies (drop the expansion metadata)
-            movies = [movie for movie, _ in paginated_expanded]
+    use_fast_path = not first_sort_needs_expansion
+
+    # Per-movie tmdb_data (or just its listed fields) for the response, when
+    # already parsed or fetched separately below
+    listing_tmdb = None
+    if use_fast_path:
+        # Plain COUNT over the filtered table; Query.count() would wrap the
+        # whole ordered SELECT in a subquery
+        total = query.with_entities(func.count(Movie.id)).order_by(None).scalar()
+        if count_only:
+            return {"movies": [], "total": total, "skip": 0, "limit": 0}
+        if db.bind.dialect.name == 'sqlite':
+            # Only a few tmdb_data fields are shown in the list, so extract
+            # those in SQL rather than loading each movie's full TMDB blob
+            rows = query.options(LISTING_COLUMNS).add_columns(listing_tmdb_fields()).offset(skip).limit(limit).all()
+            movies = [movie for movie, _ in rows]
+            listing_tmdb = {movie.id: fields for movie, fields in rows}
         else:
-            # Normal sorting path (no genre expansion)
-            # Get total count from filtered list
-            total = len(all_movies)
-
-            # Apply pagination to filtered list
-            movies = all_movies[skip:skip + limit]
-
+            movies = query.offset(skip).limit(limit).all()
+    else:
+        # Sorting by genres or production_company first lists a movie once
+        # per genre/company: expand, count and page the rows in SQL
+        expanded_query, expansion_value = expand_listing_query(query, first_sort_field)
+        total = expanded_query.with_entities(func.count(Movie.id)).order_by(None).scalar()
         if count_only:
             return {"movies": [], "total": total, "skip": 0, "limit": 0}
 
-    # Pre-fetch tracked list memberships for all movies in one query (more efficient)
-    tracked_list_columns = get_tracked_list_names()
+        first_sort_order = sorts_list[0].get('order', 'asc')
+        expansion_order = [expansion_value.desc().nullslast() if first_sort_order == 'desc' else expansion_value.asc().nullslast()]
+        for sort_obj in sorts_list[1:]:
+            if isinstance(sort_obj, dict) and sort_obj.get('field') in EXPANSION_SORT_KEYS:
+                key = EXPANSION_SORT_KEYS[sort_obj['field']]
+                expansion_order.append(key.desc().nullslast() if sort_obj.get('order', 'asc') == 'desc' else key.asc().nullslast())
+        # Ties keep the regular listing order
+        rows = (
+            expanded_query.order_by(None).order_by(*expansion_order, *order_by_list)
+            .options(LISTING_COLUMNS).add_columns(listing_tmdb_fields(), expansion_value)
+            .offset(skip).limit(limit).all()
+        )
+        movies = [movie for movie, _, _ in rows]
+        listing_tmdb = {movie.id: fields for movie, fields, _ in rows}
+
+    # Pre-fetch tracked list memberships for the page's movies in bulk
     tracked_list_data = {}
     if tracked_list_columns and movies:
         movie_ids = [movie.id for movie in movies]
-        if movie_ids:
-            # Build query to get all tracked list columns for all movies at once
-            # IDs are safe since they come from the database
-            columns_str = ', '.join(['id'] + tracked_list_columns)
-            ids_str = ', '.join([str(mid) for mid in movie_ids])
-            query_str = f"SELECT {columns_str} FROM movies WHERE id IN ({ids_str})"
-            results = db.execute(text(query_str)).fetchall()
-            
-            # Build a dictionary mapping movie_id to list memberships
-            for result in results:
-                movie_id = result[0]
-                list_memberships = {}
-                for idx, column_name in enumerate(tracked_list_columns):
-                    # SQLite stores booleans as integers (0/1)
-                    value = result[idx + 1] if result[idx + 1] is not None else 0
-                    list_memberships[column_name] = bool(value)
-                tracked_list_data[movie_id] = list_memberships
+        memberships_query = text(
+            f"SELECT id, {', '.join(tracked_list_columns)} FROM movies WHERE id IN :ids"
+        ).bindparams(bindparam('ids', expanding=True))
+        for i in range(0, len(movie_ids), IN_CLAUSE_CHUNK_SIZE):
+            chunk = movie_ids[i:i + IN_CLAUSE_CHUNK_SIZE]
+            # SQLite stores the flags as 0/1 integers (NULL counts as not on the list)
+            for row in db.execute(memberships_query, {'ids': chunk}):
+                tracked_list_data[row[0]] = dict(zip(tracked_list_columns, map(bool, row[1:])))
     
     # Convert to dict format
     movies_data = []
     for movie in movies:
-        # Extract poster URL, original_language, and other TMDB fields if available
-        poster_url = None
-        original_language = None
-        production_company = None
-        in_collection = False
-        if movie.tmdb_data:
-            # Handle both dict and string (JSON) formats
-            # SQLite stores JSON as TEXT, SQLAlchemy should deserialize it automatically
-            # but sometimes it might come as a string
-            tmdb_data = movie.tmdb_data
-            if isinstance(tmdb_data, str):
-                try:
-                    tmdb_data = json.loads(tmdb_data)
-                except (json.JSONDecodeError, TypeError):
-                    logger.warning(f"Could not parse tmdb_data for movie {movie.id}: {type(tmdb_data)}")
-                    tmdb_data = None
-            
-            if isinstance(tmdb_data, dict):
-                poster_path = tmdb_data.get('poster_path')
-                # Check if poster_path exists and is not None/empty
-                if poster_path and str(poster_path).strip() and str(poster_path).lower() != 'none':
-                    poster_path = str(poster_path).strip()
-                    # Ensure poster_path starts with / if it doesn't already
-                    if not poster_path.startswith('/'):
-                        poster_path = '/' + poster_path
-                    poster_url = f"https://image.tmdb.org/t/p/w300{poster_path}"
-                else:
-                    logger.debug(f"No valid poster_path for movie {movie.id} ({movie.title}): {poster_path}")
-                
-                # Extract original_language
-                original_language = tmdb_data.get('original_language')
-                # Handle empty strings as None
-                if original_language == '' or original_language is None:
-                    original_language = None
-                # Log if original_language is missing (for debugging)
-                if original_language is None and logger.isEnabledFor(logging.DEBUG):
-                    logger.debug(f"original_language not found in tmdb_data for movie {movie.id} ({movie.title})")
-                
-                # Extract production_company (take first company name, or join if multiple)
-                production_companies = tmdb_data.get('production_companies', [])
-                if production_companies and isinstance(production_companies, list) and len(production_companies) > 0:
-                    company_names = [company.get('name') for company in production_companies if isinstance(company, dict) and company.get('name')]
-                    if company_names:
-                        production_company = company_names[0]  # Use first company, or could join all
-                
-                # Extract collection status
-                belongs_to_collection = tmdb_data.get('belongs_to_collection')
-                in_collection = belongs_to_collection is not None and belongs_to_collection != ''
-            else:
-                logger.debug(f"tmdb_data is not a dict for movie {movie.id}: {type(tmdb_data)}")
+        movie_tmdb_data = listing_tmdb[movie.id] if listing_tmdb is not None else movie.tmdb_data
         
         # Get tracked list memberships from pre-fetched data
         list_memberships = tracked_list_data.get(movie.id, {})
@@ -1687,35 +1691,7 @@ def get_movies(
             # If not found in pre-fetched data, initialize with all False
             list_memberships = {col: False for col in tracked_list_columns}
         
-        # Format created_at as ISO string for frontend
-        date_added = None
-        if movie.created_at:
-            if isinstance(movie.created_at, str):
-                date_added = movie.created_at
-            else:
-                # Convert datetime to ISO format string
-                date_added = movie.created_at.isoformat()
-        
-        movies_data.append({
-            "id": movie.id,
-            "title": movie.title,
-            "year": movie.year,
-            "letterboxd_uri": movie.letterboxd_uri,
-            "director": movie.director,
-            "country": movie.country,
-            "runtime": movie.runtime,
-            "genres": movie.genres or [],
-            "tmdb_id": movie.tmdb_id,
-            "poster_url": poster_url,
-            "original_language": original_language,
-            "is_favorite": bool(movie.is_favorite),
-            "seen_before": bool(movie.seen_before) if hasattr(movie, 'seen_before') else False,
-            "notes": movie.notes or "",
-            "production_company": production_company,
-            "in_collection": in_collection,
-            "date_added": date_added,
-            **list_memberships
-        })
+        movies_data.append(movie_list_item(movie, movie_tmdb_data, list_memberships))
     
     return {
         "movies": movies_data,
@@ -1725,52 +1701,34 @@ def get_movies(
     }
 
 @router.get("/api/movies/stats")
+@cached_movie_summary("stats")
 def get_stats(db: Session = Depends(get_db)):
     """
     Get statistics about the movie collection.
     """
-    total_movies = db.query(Movie).count()
-    
-    # Year distribution
-    years = db.query(Movie.year).all()
-    year_list = [y[0] for y in years if y[0] is not None]
-    year_min = min(year_list) if year_list else None
-    year_max = max(year_list) if year_list else None
-    
-    # Total runtime
-    runtimes = db.query(Movie.runtime).filter(Movie.runtime.isnot(None)).all()
-    runtime_list = [r[0] for r in runtimes if r[0] is not None]
-    total_runtime = sum(runtime_list) if runtime_list else 0
-    
-    # Unique directors
-    directors = db.query(Movie.director).filter(Movie.director.isnot(None)).distinct().all()
-    unique_directors = len([d[0] for d in directors if d[0]])
-    
-    # Unique countries
-    countries = db.query(Movie.country).filter(Movie.country.isnot(None)).distinct().all()
-    unique_countries = len([c[0] for c in countries if c[0]])
-    
-    # Favorite movies count
-    favorite_movies_count = db.query(Movie).filter(Movie.is_favorite.is_(True)).count()
-    
-    # Favorite movies runtime
-    favorite_runtimes = db.query(Movie.runtime).filter(
-        Movie.is_favorite.is_(True),
-        Movie.runtime.isnot(None)
-    ).all()
-    favorite_runtime_list = [r[0] for r in favorite_runtimes if r[0] is not None]
-    favorite_runtime = sum(favorite_runtime_list) if favorite_runtime_list else 0
-    
-    # Genre distribution
-    all_genres = []
-    movies_with_genres = db.query(Movie.genres).filter(Movie.genres.isnot(None)).all()
-    for genres in movies_with_genres:
-        if genres[0]:
-            all_genres.extend(genres[0])
-    
-    genre_counts = {}
-    for genre in all_genres:
-        genre_counts[genre] = genre_counts.get(genre, 0) + 1
+    # Every scalar statistic in one aggregate query (empty director/country
+    # names don't count as distinct values)
+    (
+        total_movies, favorite_movies_count, year_min, year_max, total_runtime,
+        favorite_runtime, unique_directors, unique_countries
+    ) = db.query(
+        func.count(Movie.id),
+        func.coalesce(func.sum(cast(Movie.is_favorite, Integer)), 0),
+        func.min(Movie.year),
+        func.max(Movie.year),
+        func.coalesce(func.sum(Movie.runtime), 0),
+        func.coalesce(func.sum(case((Movie.is_favorite.is_(True), Movie.runtime))), 0),
+        func.count(func.distinct(func.nullif(Movie.director, ''))),
+        func.count(func.distinct(func.nullif(Movie.country, '')))
+    ).one()
+    
+    # Genre distribution, counted in SQL over each movie's genres array
+    genre = movie_genre_entries()
+    genre_counts = dict(
+        db.query(genre.c.value, func.count()).select_from(Movie).join(genre, true())
+        .filter(func.json_type(Movie.genres) == 'array', genre.c.value.isnot(None))
+        .group_by(genre.c.value).order_by(genre.c.value).all()
+    )
     
     return {
         "total_movies": total_movies,
@@ -1787,6 +1745,7 @@ def get_stats(db: Session = Depends(get_db)):
     }
 
 @router.get("/api/movies/directors")
+@cached_movie_summary("directors")
 def get_directors(db: Session = Depends(get_db)):
     """
     Get list of all unique directors.
@@ -1798,6 +1757,7 @@ def get_directors(db: Session = Depends(get_db)):
     return [d[0] for d in directors if d[0]]
 
 @router.get("/api/movies/countries")
+@cached_movie_summary("countries")
 def get_countries(db: Session = Depends(get_db)):
     """
     Get list of all unique countries.
@@ -1809,171 +1769,70 @@ def get_countries(db: Session = Depends(get_db)):
     return [c[0] for c in countries if c[0]]
 
 @router.get("/api/movies/genres")
+@cached_movie_summary("genres")
 def get_genres(db: Session = Depends(get_db)):
     """
     Get list of all unique genres.
     """
-    all_genres = set()
-    movies_with_genres = db.query(Movie.genres).filter(Movie.genres.isnot(None)).all()
-    for genres in movies_with_genres:
-        if genres[0]:
-            all_genres.update(genres[0])
-    
-    return sorted(list(all_genres))
+    return facet_values(db, 'genre')
 
 @router.get("/api/movies/original-languages")
+@cached_movie_summary("original_languages")
 def get_original_languages(db: Session = Depends(get_db)):
     """
     Get list of all unique original languages.
     """
-    all_languages = set()
-    movies = db.query(Movie).filter(Movie.tmdb_data.isnot(None)).all()
-    for movie in movies:
-        if movie.tmdb_data:
-            tmdb_data = movie.tmdb_data
-            if isinstance(tmdb_data, str):
-                try:
-                    tmdb_data = json.loads(tmdb_data)
-                except (json.JSONDecodeError, TypeError):
-                    continue
-            if isinstance(tmdb_data, dict):
-                original_language = tmdb_data.get('original_language')
-                if original_language:
-                    all_languages.add(original_language)
+    # original_language is an indexed column generated from tmdb_data
+    languages = db.query(Movie.original_language).filter(
+        Movie.original_language.isnot(None),
+        Movie.original_language != ''
+    ).distinct().order_by(Movie.original_language).all()
     
-    return sorted(list(all_languages))
+    return [l[0] for l in languages]
 
 @router.get("/api/movies/production-companies")
+@cached_movie_summary("production_companies")
 def get_production_companies(db: Session = Depends(get_db)):
     """
     Get list of all unique production companies.
     """
-    all_companies = set()
-    movies = db.query(Movie).filter(Movie.tmdb_data.isnot(None)).all()
-    for movie in movies:
-        if movie.tmdb_data:
-            tmdb_data = movie.tmdb_data
-            if isinstance(tmdb_data, str):
-                try:
-                    tmdb_data = json.loads(tmdb_data)
-                except (json.JSONDecodeError, TypeError):
-                    continue
-            if isinstance(tmdb_data, dict):
-                production_companies = tmdb_data.get('production_companies', [])
-                for company in production_companies:
-                    if isinstance(company, dict):
-                        company_name = company.get('name')
-                        if company_name:
-                            all_companies.add(company_name)
-    
-    return sorted(list(all_companies))
+    return facet_values(db, 'production_company')
 
 @router.get("/api/movies/spoken-languages")
+@cached_movie_summary("spoken_languages")
 def get_spoken_languages(db: Session = Depends(get_db)):
     """
     Get list of all unique spoken languages (ISO codes).
     """
-    all_languages = set()
-    movies = db.query(Movie).filter(Movie.tmdb_data.isnot(None)).all()
-    for movie in movies:
-        if movie.tmdb_data:
-            tmdb_data = movie.tmdb_data
-            if isinstance(tmdb_data, str):
-                try:
-                    tmdb_data = json.loads(tmdb_data)
-                except (json.JSONDecodeError, TypeError):
-                    continue
-            if isinstance(tmdb_data, dict):
-                spoken_languages = tmdb_data.get('spoken_languages', [])
-                for lang in spoken_languages:
-                    if isinstance(lang, dict):
-                        iso_code = lang.get('iso_639_1')
-                        if iso_code:
-                            all_languages.add(iso_code)
-    
-    return sorted(list(all_languages))
+    languages = db.query(MovieSpokenLanguage.iso_639_1).filter(
+        MovieSpokenLanguage.iso_639_1 != ''
+    ).distinct().order_by(MovieSpokenLanguage.iso_639_1).all()
+    
+    return [l[0] for l in languages]
 
 @router.get("/api/movies/actors")
+@cached_movie_summary("actors")
 def get_actors(db: Session = Depends(get_db)):
     """
     Get list of all unique actors from cast.
     """
-    all_actors = set()
-    movies = db.query(Movie).filter(Movie.tmdb_data.isnot(None)).all()
-    for movie in movies:
-        if movie.tmdb_data:
-            tmdb_data = movie.tmdb_data
-            if isinstance(tmdb_data, str):
-                try:
-                    tmdb_data = json.loads(tmdb_data)
-                except (json.JSONDecodeError, TypeError):
-                    continue
-            if isinstance(tmdb_data, dict):
-                credits = tmdb_data.get('credits', {})
-                cast = credits.get('cast', [])
-                for actor in cast:
-                    if isinstance(actor, dict):
-                        actor_name = actor.get('name')
-                        if actor_name:
-                            all_actors.add(actor_name)
-    
-    return sorted(list(all_actors))
+    return people_names(db, 'actor')
 
 @router.get("/api/movies/writers")
+@cached_movie_summary("writers")
 def get_writers(db: Session = Depends(get_db)):
     """
     Get list of all unique writers from crew.
     """
-    all_writers = set()
-    movies = db.query(Movie).filter(Movie.tmdb_data.isnot(None)).all()
-    for movie in movies:
-        if movie.tmdb_data:
-            tmdb_data = movie.tmdb_data
-            if isinstance(tmdb_data, str):
-                try:
-                    tmdb_data = json.loads(tmdb_data)
-                except (json.JSONDecodeError, TypeError):
-                    continue
-            if isinstance(tmdb_data, dict):
-                credits = tmdb_data.get('credits', {})
-                crew = credits.get('crew', [])
-                for person in crew:
-                    if isinstance(person, dict):
-                        job = person.get('job')
-                        if job in ('Writer', 'Screenplay'):
-                            writer_name = person.get('name')
-                            if writer_name:
-                                all_writers.add(writer_name)
-    
-    return sorted(list(all_writers))
+    return people_names(db, 'writer')
 
 @router.get("/api/movies/producers")
+@cached_movie_summary("producers")
 def get_producers(db: Session = Depends(get_db)):
     """
     Get list of all unique producers from crew.
     """
-    all_producers = set()
-    movies = db.query(Movie).filter(Movie.tmdb_data.isnot(None)).all()
-    for movie in movies:
-        if movie.tmdb_data:
-            tmdb_data = movie.tmdb_data
-            if isinstance(tmdb_data, str):
-                try:
-                    tmdb_data = json.loads(tmdb_data)
-                except (json.JSONDecodeError, TypeError):
-                    continue
-            if isinstance(tmdb_data, dict):
-                credits = tmdb_data.get('credits', {})
-                crew = credits.get('crew', [])
-                for person in crew:
-                    if isinstance(person, dict):
-                        job = person.get('job')
-                        if job in ('Producer', 'Executive Producer'):
-                            producer_name = person.get('name')
-                            if producer_name:
-                                all_producers.add(producer_name)
-    
-    return sorted(list(all_producers))
+    return people_names(db, 'producer')
 
 @router.get("/api/movies/search-tmdb")
 def search_tmdb_movie(
@@ -2046,6 +1905,11 @@ def search_tmdb_movie(
         logger.error(f"Error searching TMDB for '{title}': {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error searching TMDB: {str(e)}")
 
+class CsvEchoBuffer:
+    """File-like target for csv.writer that hands each formatted row back instead of storing it."""
+    def write(self, value: str) -> str:
+        return value
+
 @router.get("/api/movies/export")
 def export_movies(
     format: str = Query("csv", regex="^(csv|json|markdown|letterboxd)$"),
@@ -2072,57 +1936,19 @@ def export_movies(
     Export movies in various formats (CSV, JSON, Markdown).
     Supports all the same filters as GET /api/movies.
     """
-    # Use the same filtering logic as get_movies by calling it
-    # We need to get all matching movies, so set a high limit
-    export_limit = limit if limit else 100000
-    
-    # Call get_movies with all the same parameters
-    # Note: Must pass None explicitly for parameters not in export endpoint to avoid Query object issues
-    movies_result = get_movies(
-        skip=0,
-        limit=export_limit,
-        year_min=year_min,
-        year_max=year_max,
-        director=director,
-        director_exclude=director_exclude,
-        country=country,
-        country_exclude=country_exclude,
-        genre=genre,
-        genre_exclude=genre_exclude,
-        runtime_min=runtime_min,
-        runtime_max=runtime_max,
-        search=search,
-        favorites_only=favorites_only,
-        list_filters=list_filters,
-        # Parameters not in export endpoint - pass None explicitly
-        original_language=None,
-        original_language_exclude=False,
-        production_company=None,
-        production_company_exclude=False,
-        spoken_language=None,
-        actor=None,
-        actor_exclude=False,
-        writer=None,
-        writer_exclude=False,
-        producer=None,
-        producer_exclude=False,
-        collection=None,
-        date_added_min=None,
-        date_added_max=None,
-        sort_by=None,
-        sort_order=None,
-        sorts=None,
-        show_favorites_first=False,
-        streaming_service=None,
-        watch_region=None,  # This was causing the error - must be None, not Query object
-        streaming_provider_type=None,
-        availability_type=None,
-        availability_exclude=False,
-        preferred_services=None,
-        db=db
+    # Same filters as get_movies, streamed straight from the ORM rows
+    tracked_list_columns = get_tracked_list_names()
+    query = build_movies_query(
+        db, tracked_list_columns,
+        year_min=year_min, year_max=year_max,
+        director=director, director_exclude=director_exclude,
+        country=country, country_exclude=country_exclude,
+        genre=genre, genre_exclude=genre_exclude,
+        runtime_min=runtime_min, runtime_max=runtime_max,
+        search=search, favorites_only=favorites_only,
+        list_filters=list_filters
     )
-    
-    movies = movies_result["movies"]
+    export_limit = limit if limit else 100000
     
     # Parse columns if provided
     selected_columns = None
@@ -2138,19 +1964,46 @@ def export_movies(
         if include_notes:
             selected_columns.append("notes")
     
-    # Export based on format
-    if format == "letterboxd":
+    # Only the tracked lists that are exported are read
+    exported_lists = [col for col in tracked_list_columns if col in selected_columns]
+    
+    def export_movie_items():
+        """Listing dicts for the filtered movies, in the default listing order."""
+        if query is None:
+            return
+        # Only the listed tmdb_data fields, extracted in SQL (see get_movies)
+        tmdb_column = listing_tmdb_fields() if db.bind.dialect.name == 'sqlite' else Movie.tmdb_data
+        rows = (
+            query.options(LISTING_COLUMNS)
+            .add_columns(tmdb_column, *(tracked_list_column(col) for col in exported_lists))
+            .order_by(*DEFAULT_LISTING_ORDER).offset(skip).limit(export_limit)
+            .yield_per(SCAN_BATCH_SIZE)
+        )
+        for movie, movie_tmdb_data, *flags in rows:
+            # SQLite stores the flags as 0/1 integers (NULL counts as not on the list)
+            yield movie_list_item(movie, movie_tmdb_data, dict(zip(exported_lists, map(bool, flags))))
+    
+    def export_value(movie: Dict[str, Any], col: str) -> str:
+        value = movie.get(col, "")
+        if isinstance(value, list):
+            value = ", ".join(str(v) for v in value)
+        elif value is None:
+            value = ""
+        return str(value)
+    
+    def csv_stream(header: List[str], row_values: Callable[[Dict[str, Any]], List[Any]]):
         import csv
-        from io import StringIO
-        
-        output = StringIO()
-        writer = csv.writer(output)
-        
-        # Write header with Letterboxd format column names
-        writer.writerow(["Title", "Year", "Directors", "LetterboxdURI"])
         
-        # Write rows
-        for movie in movies:
+        # writerow() returns what it wrote to the pass-through buffer, so each
+        # row is sent as soon as it's formatted
+        writer = csv.writer(CsvEchoBuffer())
+        yield writer.writerow(header)
+        for movie in export_movie_items():
+            yield writer.writerow(row_values(movie))
+    
+    # Export based on format
+    if format == "letterboxd":
+        def letterboxd_row(movie: Dict[str, Any]) -> List[Any]:
             title = movie.get("title", "")
             year = movie.get("year", "")
             director = movie.get("director", "")
@@ -2160,123 +2013,83 @@ def export_movies(
             else:
                 directors = str(director) if director else ""
             letterboxd_uri = movie.get("letterboxd_uri", "")
-            
-            writer.writerow([title, year, directors, letterboxd_uri])
+            return [title, year, directors, letterboxd_uri]
         
-        return Response(
-            content=output.getvalue(),
+        # Write header with Letterboxd format column names
+        return StreamingResponse(
+            csv_stream(["Title", "Year", "Directors", "LetterboxdURI"], letterboxd_row),
             media_type="text/csv",
             headers={"Content-Disposition": f'attachment; filename="letterboxd-export-{datetime.utcnow().strftime("%Y%m%d")}.csv"'}
         )
     
     elif format == "csv":
-        import csv
-        from io import StringIO
-        
-        output = StringIO()
-        writer = csv.writer(output)
-        
-        # Write header
-        writer.writerow(selected_columns)
-        
-        # Write rows
-        for movie in movies:
-            row = []
-            for col in selected_columns:
-                value = movie.get(col, "")
-                if isinstance(value, list):
-                    value = ", ".join(str(v) for v in value)
-                elif value is None:
-                    value = ""
-                row.append(str(value))
-            writer.writerow(row)
-        
-        return Response(
-            content=output.getvalue(),
+        return StreamingResponse(
+            csv_stream(selected_columns, lambda movie: [export_value(movie, col) for col in selected_columns]),
             media_type="text/csv",
             headers={"Content-Disposition": f'attachment; filename="movies-export-{datetime.utcnow().strftime("%Y%m%d")}.csv"'}
         )
     
     elif format == "json":
-        # Filter movies to only include selected columns
-        filtered_movies = []
-        for movie in movies:
-            filtered_movie = {col: movie.get(col) for col in selected_columns}
-            filtered_movies.append(filtered_movie)
-        
-        json_str = json.dumps(filtered_movies, indent=2, ensure_ascii=False)
-        return Response(
-            content=json_str,
+        def json_stream():
+            # A 2-space indented JSON array (as orjson.OPT_INDENT_2 would write it), one movie at a time
+            separator = b"[\n"
+            for movie in export_movie_items():
+                # Include only the selected columns
+                filtered_movie = {col: movie.get(col) for col in selected_columns}
+                item = orjson.dumps(filtered_movie, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+                yield separator + b"  " + item.replace(b"\n", b"\n  ")
+                separator = b",\n"
+            yield b"[]" if separator == b"[\n" else b"\n]"
+        
+        return StreamingResponse(
+            json_stream(),
             media_type="application/json",
             headers={"Content-Disposition": f'attachment; filename="movies-export-{datetime.utcnow().strftime("%Y%m%d")}.json"'}
         )
     
     elif format == "markdown":
-        output_lines = ["# Movies Export\n"]
-        output_lines.append(f"Exported: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        output_lines.append(f"Total: {len(movies)} movies\n\n")
-        output_lines.append("| " + " | ".join(selected_columns) + " |")
-        output_lines.append("| " + " | ".join(["---"] * len(selected_columns)) + " |")
-        
-        for movie in movies:
-            row = []
-            for col in selected_columns:
-                value = movie.get(col, "")
-                if isinstance(value, list):
-                    value = ", ".join(str(v) for v in value)
-                elif value is None:
-                    value = ""
+        total = 0
+        if query is not None:
+            total = query.with_entities(func.count(Movie.id)).scalar()
+        exported_count = max(0, min(total - skip, export_limit))
+        
+        def markdown_stream():
+            output_lines = ["# Movies Export\n"]
+            output_lines.append(f"Exported: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            output_lines.append(f"Total: {exported_count} movies\n\n")
+            output_lines.append("| " + " | ".join(selected_columns) + " |")
+            output_lines.append("| " + " | ".join(["---"] * len(selected_columns)) + " |")
+            yield "\n".join(output_lines)
+            
+            for movie in export_movie_items():
                 # Escape pipe characters in markdown
-                value = str(value).replace("|", "\\|")
-                row.append(str(value))
-            output_lines.append("| " + " | ".join(row) + " |")
+                row = [export_value(movie, col).replace("|", "\\|") for col in selected_columns]
+                yield "\n| " + " | ".join(row) + " |"
         
-        return Response(
-            content="\n".join(output_lines),
+        return StreamingResponse(
+            markdown_stream(),
             media_type="text/markdown",
             headers={"Content-Disposition": f'attachment; filename="movies-export-{datetime.utcnow().strftime("%Y%m%d")}.md"'}
         )
 
-@router.get("/api/movies/{movie_id}")
-def get_movie(movie_id: int, db: Session = Depends(get_db)):
+def movie_with_list_memberships(db: Session, movie_id: int) -> Tuple[Optional[Movie], Dict[str, bool]]:
     """
-    Get a single movie by ID with all TMDB data.
+    Load a movie and its tracked list memberships in one SELECT. The tracked
+    list flags are dynamically added columns, so they aren't on the model.
     """
-    movie = db.query(Movie).filter(Movie.id == movie_id).first()
-    if not movie:
-        raise HTTPException(status_code=404, detail="Movie not found")
-    
-    # Get tracked list memberships
-    # Since these columns are dynamically added and not in the model,
-    # we need to query them directly from the database
     tracked_list_columns = get_tracked_list_names()
-    list_memberships = {}
-    if tracked_list_columns:
-        result = db.execute(
-            text(f"SELECT {', '.join([col for col in tracked_list_columns])} FROM movies WHERE id = :movie_id"),
-            {"movie_id": movie.id}
-        ).fetchone()
-        if result:
-            for idx, column_name in enumerate(tracked_list_columns):
-                # SQLite stores booleans as integers (0/1)
-                value = result[idx] if result[idx] is not None else 0
-                list_memberships[column_name] = bool(value)
-        else:
-            # If no result, set all to False
-            for column_name in tracked_list_columns:
-                list_memberships[column_name] = False
-    
-    # Format created_at as ISO string for frontend
-    date_added = None
-    if movie.created_at:
-        if isinstance(movie.created_at, str):
-            date_added = movie.created_at
-        else:
-            # Convert datetime to ISO format string
-            date_added = movie.created_at.isoformat()
-    
-    # Build response with all available data
-    movie_data = {
+    row = db.query(Movie).add_columns(
+        *(tracked_list_column(col) for col in tracked_list_columns)
+    ).filter(Movie.id == movie_id).first()
+    if row is None:
+        return None, {}
+    movie, *flags = row
+    # SQLite stores booleans as integers (0/1); NULL counts as not on the list
+    return movie, dict(zip(tracked_list_columns, map(bool, flags)))
+
+def movie_detail(movie: Movie, list_memberships: Dict[str, bool]) -> Dict[str, Any]:
+    """A single movie with all TMDB data, as returned by GET /api/movies/{movie_id}."""
+    return {
         "id": movie.id,
         "title": movie.title,
         "year": movie.year,
@@ -2290,11 +2103,21 @@ def get_movie(movie_id: int, db: Session = Depends(get_db)):
         "is_favorite": bool(movie.is_favorite),
         "seen_before": bool(movie.seen_before) if hasattr(movie, 'seen_before') else False,
         "notes": movie.notes or "",
-        "date_added": date_added,
+        # Format created_at as ISO string for frontend
+        "date_added": format_date_added(movie.created_at),
         **list_memberships
     }
+
+@router.get("/api/movies/{movie_id}")
+def get_movie(movie_id: int, db: Session = Depends(get_db)):
+    """
+    Get a single movie by ID with all TMDB data.
+    """
+    movie, list_memberships = movie_with_list_memberships(db, movie_id)
+    if not movie:
+        raise HTTPException(status_code=404, detail="Movie not found")
     
-    return movie_data
+    return movie_detail(movie, list_memberships)
 
 @router.post("/api/movies")
 def add_movie(
@@ -2328,21 +2151,16 @@ def add_movie(
     if not year or not isinstance(year, int) or year < 1888 or year > 2100:
         raise HTTPException(status_code=400, detail="Valid year is required (1888-2100)")
     
-    # Check for duplicates by letterboxd_uri (if provided)
-    existing = None
+    # Check for duplicates by letterboxd_uri (if provided) or title+year, in one query
+    duplicate_condition = and_(Movie.title == title, Movie.year == year)
     if letterboxd_uri:
-        existing = db.query(Movie).filter(
-            Movie.letterboxd_uri == letterboxd_uri
-        ).first()
-    
-    # Also check for existing movie by title+year to prevent duplicates
-    if not existing:
-        existing = db.query(Movie).filter(
-            Movie.title == title,
-            Movie.year == year
-        ).first()
-        if existing:
-            logger.info(f"Movie {title} ({year}) already exists with different URI, returning existing movie")
+        duplicate_condition = or_(Movie.letterboxd_uri == letterboxd_uri, duplicate_condition)
+    candidates = db.query(Movie.id, Movie.letterboxd_uri).filter(duplicate_condition).all()
+    # A letterboxd_uri match takes precedence over a title+year match
+    existing = next((c for c in candidates if letterboxd_uri and c.letterboxd_uri == letterboxd_uri), None)
+    if not existing and candidates:
+        existing = candidates[0]
+        logger.info(f"Movie {title} ({year}) already exists with different URI, returning existing movie")
     
     if existing:
         # Return existing movie instead of creating duplicate
@@ -2357,40 +2175,25 @@ def add_movie(
     tracked_lists_dir = project_root / "tracked-lists"
     tracked_lists = load_tracked_lists(tracked_lists_dir)
     
-    # Check cache for TMDB data by title and year
-    cached_movie = db.query(Movie).filter(
-        Movie.title == title.strip(),
-        Movie.year == year
-    ).first()
-    
+    # No movie with this title and year exists (checked above), so there's no
+    # cached TMDB data to reuse
     enriched_data = None
-    
-    # If we have cached TMDB data, use it
-    if cached_movie and cached_movie.tmdb_data:
-        logger.info(f"Using cached TMDB data for {title} ({year})")
-        enriched_data = extract_enriched_data_from_tmdb(cached_movie.tmdb_data)
-    elif tmdb_client:
-        # No cache found, fetch from TMDB API
+    if tmdb_client:
         logger.info(f"Fetching TMDB data for {title} ({year})")
         enriched_data = tmdb_client.enrich_movie_data(title, year)
         if not enriched_data:
             logger.warning(f"Could not find TMDB data for {title} ({year}), creating movie with minimal data")
     
     # Create movie record
-    movie_kwargs = {
-        'title': title,
-        'year': year,
-        'letterboxd_uri': letterboxd_uri or f"letterboxd:film/{title.lower().replace(' ', '-')}-{year}",
-        'director': enriched_data.get('director') if enriched_data else None,
-        'country': enriched_data.get('country') if enriched_data else None,
-        'runtime': enriched_data.get('runtime') if enriched_data else None,
-        'genres': enriched_data.get('genres') if enriched_data else [],
-        'tmdb_id': enriched_data.get('tmdb_id') if enriched_data else None,
-        'tmdb_data': enriched_data.get('tmdb_data') if enriched_data else None,
-        'notes': notes if notes else None,
-        'is_favorite': is_favorite,
-        'seen_before': seen_before
-    }
+    movie_kwargs = build_movie_kwargs(
+        title,
+        year,
+        letterboxd_uri or f"letterboxd:film/{title.lower().replace(' ', '-')}-{year}",
+        enriched_data,
+        notes=notes if notes else None,
+        is_favorite=is_favorite,
+        seen_before=seen_before
+    )
     
     movie = Movie(**movie_kwargs)
     db.add(movie)
@@ -2404,7 +2207,6 @@ def add_movie(
         # Don't fail the entire operation if tracked list check fails
     
     db.commit()
-    db.refresh(movie)
     
     logger.info(f"Successfully added movie: {title} ({year})")
     
@@ -2412,46 +2214,9 @@ def add_movie(
     # Failures here (e.g. tracked list column missing, serialization) would otherwise cause
     # the client to see a network/500 error even though the movie was successfully saved.
     try:
-        tracked_list_columns = get_tracked_list_names()
-        list_memberships = {}
-        if tracked_list_columns:
-            result = db.execute(
-                text(f"SELECT {', '.join([col for col in tracked_list_columns])} FROM movies WHERE id = :movie_id"),
-                {"movie_id": movie.id}
-            ).fetchone()
-            if result:
-                for idx, column_name in enumerate(tracked_list_columns):
-                    value = result[idx] if result[idx] is not None else 0
-                    list_memberships[column_name] = bool(value)
-            else:
-                for column_name in tracked_list_columns:
-                    list_memberships[column_name] = False
-        
-        date_added = None
-        if movie.created_at:
-            if isinstance(movie.created_at, str):
-                date_added = movie.created_at
-            else:
-                date_added = movie.created_at.isoformat()
-        
-        movie_data = {
-            "id": movie.id,
-            "title": movie.title,
-            "year": movie.year,
-            "letterboxd_uri": movie.letterboxd_uri,
-            "director": movie.director,
-            "country": movie.country,
-            "runtime": movie.runtime,
-            "genres": movie.genres or [],
-            "tmdb_id": movie.tmdb_id,
-            "tmdb_data": movie.tmdb_data,
-            "is_favorite": bool(movie.is_favorite),
-            "seen_before": bool(movie.seen_before) if hasattr(movie, 'seen_before') else False,
-            "notes": movie.notes or "",
-            "date_added": date_added,
-            **list_memberships
-        }
-        return movie_data
+        # Reloads the committed row together with its tracked list flags
+        saved_movie, list_memberships = movie_with_list_memberships(db, movie.id)
+        return movie_detail(saved_movie, list_memberships)
     except Exception as e:
         logger.warning(f"Error building add_movie response (movie was saved): {e}")
         # Return minimal success response - frontend will refresh list via onAddSuccess
@@ -2468,7 +2233,7 @@ def add_movie(
             "is_favorite": bool(movie.is_favorite),
             "seen_before": bool(movie.seen_before) if hasattr(movie, 'seen_before') else False,
             "notes": movie.notes or "",
-            "date_added": movie.created_at.isoformat() if movie.created_at and hasattr(movie.created_at, 'isoformat') else None,
+            "date_added": format_date_added(movie.created_at),
         }
 
 @router.get("/api/movies/tmdb/{tmdb_id}/details")
@@ -2669,7 +2434,7 @@ def get_collection_movies(movie_id: int, db: Session = Depends(get_db)):
             tmdb_movies = collection_details.get('parts', [])
             
             # Get all movies from database that are in this collection
-            db_movies_query = db.query(Movie).filter(Movie.id != movie_id).all()
+            db_movies_query = db.query(Movie).filter(Movie.id != movie_id).yield_per(SCAN_BATCH_SIZE)
             db_movies_map = {}  # Map tmdb_id to database movie
             
             for m in db_movies_query:
@@ -2733,7 +2498,7 @@ def get_collection_movies(movie_id: int, db: Session = Depends(get_db)):
     else:
         # Fallback to old behavior if TMDB client is not available
         # Find all movies with the same collection ID from database only
-        all_movies = db.query(Movie).filter(Movie.id != movie_id).all()
+        all_movies = db.query(Movie).filter(Movie.id != movie_id).yield_per(SCAN_BATCH_SIZE)
         
         for m in all_movies:
             if m.tmdb_data:
@@ -2798,7 +2563,9 @@ def get_similar_movies(movie_id: int, db: Session = Depends(get_db)):
             }
         
         # Find movies in database that match these TMDb IDs
-        similar_movies = db.query(Movie).filter(
+        similar_movies = db.query(
+            Movie.id, Movie.title, Movie.year, Movie.tmdb_id, Movie.tmdb_data
+        ).filter(
             Movie.tmdb_id.in_(similar_tmdb_ids),
             Movie.id != movie_id
         ).limit(10).all()
@@ -2809,11 +2576,6 @@ def get_similar_movies(movie_id: int, db: Session = Depends(get_db)):
             poster_url = None
             if m.tmdb_data:
                 tmdb_data_movie = m.tmdb_data
-                if isinstance(tmdb_data_movie, str):
-                    try:
-                        tmdb_data_movie = json.loads(tmdb_data_movie)
-                    except:
-                        tmdb_data_movie = {}
                 if isinstance(tmdb_data_movie, dict):
                     poster_path = tmdb_data_movie.get('poster_path')
                     if poster_path:
@@ -2846,7 +2608,10 @@ def get_director_movies(director_name: str, db: Session = Depends(get_db)):
     director_movies = []
     
     # Get all movies from database with matching director
-    db_movies = db.query(Movie).filter(Movie.director == director_name).all()
+    # Plain row tuples; only these columns are needed, so skip ORM instances
+    db_movies = db.query(Movie.id, Movie.title, Movie.year, Movie.tmdb_id).filter(
+        Movie.director == director_name
+    ).all()
     db_movies_map = {}  # Map tmdb_id to database movie
     
     for m in db_movies:
@@ -2982,11 +2747,11 @@ def add_favorite_director(
     Add a director to favorites.
     """
     # Check if already favorited
-    existing = db.query(FavoriteDirector).filter(
+    existing_id = db.query(FavoriteDirector.id).filter(
         FavoriteDirector.director_name == director_name
-    ).first()
+    ).scalar()
     
-    if existing:
+    if existing_id:
         return {
             "director_name": director_name,
             "message": "Director already in favorites"
@@ -2996,6 +2761,7 @@ def add_favorite_director(
     db.add(favorite_director)
     db.commit()
     db.refresh(favorite_director)
+    invalidate_name_list(FavoriteDirector)
     
     return {
         "director_name": director_name,
@@ -3019,6 +2785,7 @@ def remove_favorite_director(
     
     db.delete(favorite_director)
     db.commit()
+    invalidate_name_list(FavoriteDirector)
     
     return {
         "director_name": director_name,
@@ -3044,11 +2811,11 @@ def add_seen_country(
     Add a country to the seen list.
     """
     # Check if already in seen list
-    existing = db.query(SeenCountry).filter(
+    existing_id = db.query(SeenCountry.id).filter(
         SeenCountry.country_name == country_name
-    ).first()
+    ).scalar()
     
-    if existing:
+    if existing_id:
         return {
             "country_name": country_name,
             "message": "Country already in seen list"
@@ -3058,6 +2825,7 @@ def add_seen_country(
     db.add(seen_country)
     db.commit()
     db.refresh(seen_country)
+    invalidate_name_list(SeenCountry)
     
     return {
         "country_name": country_name,
@@ -3081,6 +2849,7 @@ def remove_seen_country(
     
     db.delete(seen_country)
     db.commit()
+    invalidate_name_list(SeenCountry)
     
     return {
         "country_name": country_name,
@@ -3098,11 +2867,6 @@ def get_movie_streaming(movie_id: int, country_code: str = Query("US", descripti
         raise HTTPException(status_code=404, detail="Movie not found")
     
     tmdb_data = movie.tmdb_data or {}
-    if isinstance(tmdb_data, str):
-        try:
-            tmdb_data = json.loads(tmdb_data)
-        except (json.JSONDecodeError, TypeError):
-            tmdb_data = {}
     
     # Extract watch/providers data
     watch_providers = tmdb_data.get('watch', {}).get('providers', {})
@@ -3234,11 +2998,16 @@ def recache_movies(db: Session = Depends(get_db)):
         updated = 0
         failed = 0
         
-        for movie in movies:
+        # TMDB lookups are network-bound, so fetch them concurrently and
+        # apply the results on this thread (the session is not thread-safe)
+        results = enrich_movies_concurrently(tmdb_client, [(movie.title, movie.year) for movie in movies])
+        for index, enriched_data, error in results:
+            movie = movies[index]
+            if error is not None:
+                logger.error(f"Error recaching {movie.title}: {str(error)}")
+                failed += 1
+                continue
             try:
-                # Try to enrich with fresh TMDB data
-                enriched_data = tmdb_client.enrich_movie_data(movie.title, movie.year)
-                
                 if enriched_data:
                     # Update movie with fresh data
                     movie.director = enriched_data.get('director')
@@ -3276,14 +3045,8 @@ def clear_cache(db: Session = Depends(get_db)):
     This ensures that when processing CSV again, movies will be treated as new and fresh data will be fetched.
     """
     try:
-        # Get all movies and delete them individually to ensure proper deletion
-        movies = db.query(Movie).all()
-        count = len(movies)
-        
-        for movie in movies:
-            db.delete(movie)
-        
-        db.flush()  # Flush changes before commit
+        # Single bulk DELETE; no rows need to be loaded into the session
+        count = db.query(Movie).delete(synchronize_session=False)
         db.commit()
         
         logger.info(f"Deleted {count} movies from database")
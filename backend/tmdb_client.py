@@ -1,7 +1,8 @@
 import requests
 import logging
-from typing import Dict, Optional, List
-from config import TMDB_API_KEY, TMDB_BASE_URL
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterable, Iterator, Optional, List, Tuple
+from config import TMDB_API_KEY, TMDB_BASE_URL, TMDB_MAX_WORKERS
 
 logger = logging.getLogger(__name__)
 
@@ -325,5 +326,26 @@ def extract_enriched_data_from_tmdb(tmdb_data: Dict) -> Dict:
         'tmdb_data': tmdb_data
     }
 
+def enrich_movies_concurrently(
+    client: "TMDbClient",
+    movies: Iterable[Tuple[str, Optional[int]]],
+    max_workers: int = TMDB_MAX_WORKERS
+) -> Iterator[Tuple[int, Optional[Dict], Optional[Exception]]]:
+    """
+    Enrich many (title, year) pairs with a pool of worker threads.
+    Yields (index, enriched_data, error) tuples in completion order, where index
+    is the position of the pair in `movies`. Errors are returned, not raised.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(client.enrich_movie_data, title, year): index
+            for index, (title, year) in enumerate(movies)
+        }
+        for future in as_completed(futures):
+            try:
+                yield futures[future], future.result(), None
+            except Exception as e:
+                yield futures[future], None, e
+
 # Global client instance
 tmdb_client = TMDbClient(TMDB_API_KEY) if TMDB_API_KEY else None